@@ -35,13 +35,15 @@ def _init_semantic_search():
         from src.vector.semantic import SemanticSearch
         from src.vector.embeddings import OllamaEmbeddings
 
-        embeddings = OllamaEmbeddings(
+        # Only used for the health check; closed right after
+        with OllamaEmbeddings(
             base_url=settings.ollama_base_url,
             model=settings.ollama_embedding_model,
             timeout=settings.ollama_timeout
-        )
+        ) as embeddings:
+            ollama_healthy = embeddings.check_health()
 
-        if not embeddings.check_health():
+        if not ollama_healthy:
             logger.warning("Ollama not available, semantic search disabled")
             print("Ollama not available - semantic search disabled")
             return None
@@ -133,6 +135,8 @@ async def lifespan(app: FastAPI):
         from src.services.scheduler import stop_scheduler
         stop_scheduler()
         print("Sync scheduler stopped")
+    if semantic_search:
+        await semantic_search.close()
     if db:
         await db.close()
         print("Database connection closed")
@@ -1,8 +1,9 @@
 """
 Search API endpoints.
 """
+import json
 from fastapi import APIRouter, Query, Depends, HTTPException
-from typing import Optional, List
+from typing import Any, Optional, List, Tuple
 
 from .utils import get_db, build_response
 
@@ -31,6 +32,32 @@ def parse_list_param(value: Optional[str]) -> Optional[List[str]]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+def parse_cursor_param(value: Optional[str]) -> Optional[Tuple[Any, str]]:
+    """Parse a keyset cursor returned as ``next_cursor`` by a previous page.
+
+    Args:
+        value: JSON array string ``[sort_value, name_with_owner]`` or None
+
+    Returns:
+        Cursor tuple or None
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if not value:
+        return None
+    try:
+        sort_value, name_with_owner = json.loads(value)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return sort_value, name_with_owner
+
+
+def encode_cursor(cursor: Optional[Tuple[Any, str]]) -> Optional[str]:
+    """Encode a keyset cursor for the response (inverse of parse_cursor_param)."""
+    return json.dumps(list(cursor), ensure_ascii=False) if cursor else None
+
+
 @router.get("/search")
 async def search_repositories(
     q: Optional[str] = None,
@@ -45,11 +72,17 @@ async def search_repositories(
     owner_type: Optional[str] = None,
     exclude_archived: bool = True,
     include_related: bool = True,
+    cursor: Optional[str] = None,
     search_service = Depends(get_search_service)
 ):
-    """Search repositories with filters and optional related recommendations"""
+    """Search repositories with filters and optional related recommendations
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` to page
+    without OFFSET scans.
+    """
     parsed_categories = parse_list_param(categories)
     parsed_languages = parse_list_param(languages)
+    after = parse_cursor_param(cursor)
 
     if include_related:
         result = await search_service.search_with_relations(
@@ -64,9 +97,12 @@ async def search_repositories(
             is_new=is_new,
             owner_type=owner_type,
             exclude_archived=exclude_archived,
-            include_related=True
+            include_related=True,
+            after=after
         )
-        return build_response(result["results"], count=result["total"], related=result["related"])
+        response = build_response(result["results"], count=result["total"], related=result["related"])
+        response["next_cursor"] = encode_cursor(result.get("next_cursor"))
+        return response
 
     # Regular search without related repos
     result = await search_service.search(
@@ -81,9 +117,12 @@ async def search_repositories(
         is_new=is_new,
         owner_type=owner_type,
         exclude_archived=exclude_archived,
-        return_count=True
+        return_count=True,
+        after=after
     )
-    return build_response(result["results"], count=result.get("total"))
+    response = build_response(result["results"], count=result.get("total"))
+    response["next_cursor"] = encode_cursor(result.get("next_cursor"))
+    return response
 
 
 @router.get("/search/fulltext")
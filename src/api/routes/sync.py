@@ -4,6 +4,7 @@ Sync API routes.
 Provides endpoints for synchronizing GitHub starred repositories.
 """
 import asyncio
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends
@@ -201,7 +202,6 @@ async def _reanalyze_task(name_with_owner: str, db: Database):
             topics=repo.get("topics") or []
         )
 
-        from datetime import datetime
         await db.update_repository(name_with_owner, {
             "summary": analysis.get("summary", repo.get("description")),
             "categories": analysis.get("categories", []),
@@ -48,12 +48,12 @@ def _check_semantic_search_status() -> tuple[bool, bool, Optional[str]]:
     """
     try:
         from src.vector.embeddings import OllamaEmbeddings
-        embeddings = OllamaEmbeddings(
+        with OllamaEmbeddings(
             base_url=settings.ollama_base_url,
             model=settings.ollama_embedding_model
-        )
-        if embeddings.check_health():
-            return True, True, embeddings.model
+        ) as embeddings:
+            if embeddings.check_health():
+                return True, True, embeddings.model
         return True, False, None
     except Exception:
         return False, False, None
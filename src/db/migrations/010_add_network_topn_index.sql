@@ -0,0 +1,8 @@
+-- Migration 010: Add covering index for the network top-N query
+-- NetworkService.build_network pulls the most-starred repositories ordered by
+-- stargazer_count DESC. This partial covering index lets SQLite walk the index
+-- prefix without a sort or a table lookup per row.
+
+CREATE INDEX IF NOT EXISTS idx_repos_network_topn
+ON repositories(stargazer_count DESC, name_with_owner, description, categories, primary_language)
+WHERE stargazer_count IS NOT NULL;
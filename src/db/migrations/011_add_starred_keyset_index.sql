@@ -0,0 +1,7 @@
+-- Migration 011: Add composite index for keyset pagination
+-- search_repositories orders by (starred_at, name_with_owner) and seeks past the
+-- previous page's cursor, so pages are read as an index range scan instead of
+-- scanning and discarding OFFSET rows.
+
+CREATE INDEX IF NOT EXISTS idx_repos_starred
+ON repositories(starred_at DESC, name_with_owner DESC);
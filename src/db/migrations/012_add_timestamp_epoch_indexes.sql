@@ -0,0 +1,10 @@
+-- Migration 012: Index pushed_at / created_at as Unix epochs
+-- The is_active / is_new filters compare strftime('%s', ...) epochs, which
+-- normalizes mixed ISO formats ("Z", "+00:00", other offsets) and turns the
+-- filter into an integer range scan on these expression indexes.
+
+CREATE INDEX IF NOT EXISTS idx_repos_pushed_at_epoch
+ON repositories(CAST(strftime('%s', pushed_at) AS INTEGER));
+
+CREATE INDEX IF NOT EXISTS idx_repos_created_at_epoch
+ON repositories(CAST(strftime('%s', created_at) AS INTEGER));
@@ -0,0 +1,14 @@
+-- Migration 013: Only reindex FTS5 when indexed columns change
+-- repositories_au fired on every UPDATE (sync timestamps, graph status, and the
+-- update_repositories_timestamp trigger itself), doing a delete + insert into
+-- the FTS index each time. Restrict it to the columns repositories_fts indexes.
+
+DROP TRIGGER IF EXISTS repositories_au;
+
+CREATE TRIGGER IF NOT EXISTS repositories_au
+AFTER UPDATE OF name_with_owner, name, description, summary ON repositories BEGIN
+    INSERT INTO repositories_fts(repositories_fts, rowid, name_with_owner, name, description, summary)
+    VALUES ('delete', old.rowid, old.name_with_owner, old.name, old.description, old.summary);
+    INSERT INTO repositories_fts(rowid, name_with_owner, name, description, summary)
+    VALUES (new.rowid, new.name_with_owner, new.name, new.description, new.summary);
+END;
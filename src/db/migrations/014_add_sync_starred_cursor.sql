@@ -0,0 +1,5 @@
+-- Migration 014: Persist the starred_at cursor of each sync
+-- Incremental syncs only fetch stars newer than the latest starred_at seen by the
+-- last successful sync, instead of re-enumerating every starred repository.
+
+ALTER TABLE sync_history ADD COLUMN last_starred_at TIMESTAMP;
@@ -1,13 +1,54 @@
 """
 SQLite database implementation.
 """
-import json
 import aiosqlite
+import itertools
+import orjson
+from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Union
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from .base import Database
 
+# Max bound parameters per IN (...) list, well below SQLite's variable limit
+MAX_IN_PARAMS = 500
+
+# Repository columns stored as JSON text
+JSON_COLUMNS = ("categories", "features", "use_cases", "topics", "languages")
+
+# Rows fetched per keyset page by iter_repositories
+ITER_BATCH_SIZE = 2000
+
+# Distinguishes private in-memory databases in cache keys
+_memory_db_ids = itertools.count(1)
+
+# bm25() column weights for repositories_fts (name_with_owner, name, description, summary):
+# a name hit outranks a description hit, which outranks a summary hit
+FTS_BM25_RANK = "bm25(repositories_fts, 10.0, 10.0, 3.0, 1.0)"
+
+# SQLite page cache size per connection (KiB)
+PAGE_CACHE_KIB = 64000
+
+# Timestamp columns as Unix epochs; must match the expression indexes of migration 012
+PUSHED_AT_EPOCH = "CAST(strftime('%s', r.pushed_at) AS INTEGER)"
+CREATED_AT_EPOCH = "CAST(strftime('%s', r.created_at) AS INTEGER)"
+
+REPO_INSERT_SQL = """
+    INSERT INTO repositories (
+        name_with_owner, name, owner, description,
+        primary_language, languages, topics, stargazer_count, fork_count,
+        url, homepage_url, summary, categories, features,
+        use_cases, readme_summary, readme_path,
+        readme_content, search_text, starred_at,
+        pushed_at, archived, visibility, owner_type, organization
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _dump_json(value: Any) -> str:
+    """Serialize a JSON column value (orjson; non-ASCII kept as-is)"""
+    return orjson.dumps(value).decode()
+
 
 class SQLiteDatabase(Database):
     """
@@ -24,6 +65,11 @@ class SQLiteDatabase(Database):
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        # Stable identity for result caches: the file path, or a unique token
+        # for ":memory:" (each in-memory database holds its own data)
+        self.cache_key = (
+            db_path if db_path != ":memory:" else f":memory:{next(_memory_db_ids)}"
+        )
         self._connection: Optional[aiosqlite.Connection] = None
 
     async def initialize(self) -> None:
@@ -36,6 +82,14 @@ class SQLiteDatabase(Database):
 
         # Enable foreign keys
         await self._connection.execute("PRAGMA foreign_keys = ON")
+        # WAL lets readers proceed during sync writes; with WAL, synchronous=NORMAL
+        # only fsyncs at checkpoints instead of on every commit
+        if self.db_path != ":memory:":
+            await self._connection.execute("PRAGMA journal_mode = WAL")
+            await self._connection.execute("PRAGMA synchronous = NORMAL")
+        await self._connection.execute("PRAGMA temp_store = MEMORY")
+        # Page cache in KiB (negative); keeps the repositories table and its indexes hot
+        await self._connection.execute(f"PRAGMA cache_size = -{PAGE_CACHE_KIB}")
         await self._connection.commit()
 
         # Read and execute schema
@@ -76,7 +130,8 @@ class SQLiteDatabase(Database):
         """)
 
         await self.execute("""
-            CREATE TRIGGER IF NOT EXISTS repositories_au AFTER UPDATE ON repositories BEGIN
+            CREATE TRIGGER IF NOT EXISTS repositories_au
+            AFTER UPDATE OF name_with_owner, name, description, summary ON repositories BEGIN
                 INSERT INTO repositories_fts(repositories_fts, rowid, name_with_owner, name, description, summary)
                 VALUES ('delete', old.rowid, old.name_with_owner, old.name, old.description, old.summary);
                 INSERT INTO repositories_fts(rowid, name_with_owner, name, description, summary)
@@ -93,6 +148,24 @@ class SQLiteDatabase(Database):
             await self._connection.close()
             self._connection = None
 
+    @property
+    def total_changes(self) -> int:
+        """Number of rows modified through this connection (grows on every write)"""
+        return self._connection.total_changes if self._connection else 0
+
+    async def data_version(self) -> Tuple[int, int]:
+        """
+        Token that changes whenever the database content changes.
+
+        total_changes covers writes made through this connection and
+        PRAGMA data_version covers commits made by other connections.
+        """
+        if not self._connection:
+            return (0, 0)
+        async with self._connection.execute("PRAGMA data_version") as cursor:
+            row = await cursor.fetchone()
+        return (self._connection.total_changes, row[0])
+
     # ==================== Generic Helper Methods ====================
 
     async def _update_entity(
@@ -222,44 +295,8 @@ class SQLiteDatabase(Database):
         """Add a repository to the database"""
         try:
             cursor = await self._connection.execute(
-                """
-                INSERT INTO repositories (
-                    name_with_owner, name, owner, description,
-                    primary_language, languages, topics, stargazer_count, fork_count,
-                    url, homepage_url, summary, categories, features,
-                    use_cases, readme_summary, readme_path,
-                    readme_content, search_text, starred_at,
-                    pushed_at, archived, visibility, owner_type, organization
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    repo_data.get("name_with_owner"),
-                    repo_data.get("name"),
-                    repo_data.get("owner"),
-                    repo_data.get("description"),
-                    repo_data.get("primary_language"),
-                    json.dumps(repo_data.get("languages", []), ensure_ascii=False),
-                    json.dumps(repo_data.get("topics", []), ensure_ascii=False),
-                    repo_data.get("stargazer_count", 0),
-                    repo_data.get("fork_count", 0),
-                    repo_data.get("url"),
-                    repo_data.get("homepage_url"),
-                    repo_data.get("summary"),
-                    json.dumps(repo_data.get("categories", []), ensure_ascii=False),
-                    json.dumps(repo_data.get("features", []), ensure_ascii=False),
-                    json.dumps(repo_data.get("use_cases", []), ensure_ascii=False),
-                    repo_data.get("readme_summary"),
-                    repo_data.get("readme_path"),
-                    repo_data.get("readme_content"),
-                    self._build_search_text(repo_data),
-                    repo_data.get("starred_at"),
-                    # New GitHub metadata fields
-                    repo_data.get("pushed_at"),
-                    repo_data.get("archived", 0),
-                    repo_data.get("visibility", "public"),
-                    repo_data.get("owner_type"),
-                    repo_data.get("organization")
-                )
+                REPO_INSERT_SQL,
+                self._repo_insert_params(repo_data)
             )
             await self._connection.commit()
 
@@ -272,6 +309,89 @@ class SQLiteDatabase(Database):
             print(f"Error adding repository: {e}")
             return False
 
+    async def add_repositories_bulk(
+        self,
+        repos: List[Dict[str, Any]],
+        return_names: bool = False
+    ) -> Union[int, List[str]]:
+        """Add many repositories in a single transaction.
+
+        All rows go through one executemany and one commit. If any row
+        violates a constraint the batch is rolled back and retried row by row,
+        so the valid rows are still added.
+
+        Args:
+            repos: Repository data dicts (same shape as add_repository)
+            return_names: Whether to return the names of the added repositories
+
+        Returns:
+            If return_names is True: name_with_owner of each added repository
+            Otherwise: Number of repositories added
+        """
+        added: List[str] = []
+        if repos:
+            try:
+                await self._connection.executemany(
+                    REPO_INSERT_SQL,
+                    [self._repo_insert_params(repo) for repo in repos]
+                )
+                await self._connection.executemany(
+                    """
+                    INSERT OR IGNORE INTO repo_categories (repo_id, category)
+                    SELECT id, ? FROM repositories WHERE name_with_owner = ?
+                    """,
+                    [
+                        (category, repo.get("name_with_owner"))
+                        for repo in repos
+                        for category in repo.get("categories", [])
+                    ]
+                )
+                await self._connection.commit()
+                added = [repo.get("name_with_owner") for repo in repos]
+            except aiosqlite.IntegrityError:
+                await self._connection.rollback()
+                added = [
+                    repo.get("name_with_owner")
+                    for repo in repos
+                    if await self.add_repository(repo)
+                ]
+            except Exception as e:
+                await self._connection.rollback()
+                print(f"Error adding repositories: {e}")
+
+        return added if return_names else len(added)
+
+    def _repo_insert_params(self, repo_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Build REPO_INSERT_SQL parameters from repository data"""
+        return (
+            repo_data.get("name_with_owner"),
+            repo_data.get("name"),
+            repo_data.get("owner"),
+            repo_data.get("description"),
+            repo_data.get("primary_language"),
+            _dump_json(repo_data.get("languages", [])),
+            _dump_json(repo_data.get("topics", [])),
+            repo_data.get("stargazer_count", 0),
+            repo_data.get("fork_count", 0),
+            repo_data.get("url"),
+            repo_data.get("homepage_url"),
+            repo_data.get("summary"),
+            _dump_json(repo_data.get("categories", [])),
+            _dump_json(repo_data.get("features", [])),
+            _dump_json(repo_data.get("use_cases", [])),
+            repo_data.get("readme_summary"),
+            repo_data.get("readme_path"),
+            repo_data.get("readme_content"),
+            self._build_search_text(repo_data),
+            repo_data.get("starred_at"),
+            # New GitHub metadata fields
+            repo_data.get("pushed_at"),
+            repo_data.get("archived", 0),
+            repo_data.get("visibility", "public"),
+            repo_data.get("owner_type"),
+            repo_data.get("organization")
+        )
+
     async def get_repository(
         self,
         name_with_owner: str
@@ -286,6 +406,77 @@ class SQLiteDatabase(Database):
                 return self._row_to_dict(row)
         return None
 
+    async def get_repositories(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Get multiple repositories by name_with_owner in a single query.
+
+        Args:
+            names: Repository names (owner/repo)
+
+        Returns:
+            Found repositories, in the order of ``names``
+        """
+        names = list(dict.fromkeys(names))
+        found = {}
+        for start in range(0, len(names), MAX_IN_PARAMS):
+            chunk = names[start:start + MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            async with self._connection.execute(
+                f"SELECT * FROM repositories WHERE name_with_owner IN ({placeholders})",
+                chunk
+            ) as cursor:
+                for row in await cursor.fetchall():
+                    found[row["name_with_owner"]] = self._row_to_dict(row)
+
+        return [found[name] for name in names if name in found]
+
+    async def iter_repositories(
+        self,
+        is_deleted: Optional[bool] = False,
+        batch_size: int = ITER_BATCH_SIZE,
+        columns: Optional[List[str]] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Iterate over all repositories in name_with_owner order.
+
+        Rows are fetched in keyset-paginated batches, so there is no row cap
+        and only one batch is held in memory at a time.
+
+        Args:
+            is_deleted: Filter by deleted flag (None for all rows)
+            batch_size: Rows fetched per query
+            columns: Columns to select (None for all); name_with_owner is
+                always included
+
+        Yields:
+            Repository dicts
+        """
+        select = "*"
+        if columns:
+            select = ", ".join(dict.fromkeys(["name_with_owner", *columns]))
+
+        condition = ""
+        if is_deleted is not None:
+            condition = f"AND is_deleted = {1 if is_deleted else 0}"
+
+        last_name = ""
+        while True:
+            async with self._connection.execute(
+                f"""
+                SELECT {select} FROM repositories
+                WHERE name_with_owner > ? {condition}
+                ORDER BY name_with_owner
+                LIMIT ?
+                """,
+                (last_name, batch_size)
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            for row in rows:
+                yield self._row_to_dict(row)
+
+            if len(rows) < batch_size:
+                return
+            last_name = rows[-1]["name_with_owner"]
+
     async def execute_query(self, query: str, params=(), many=False):
         """Execute a database query.
 
@@ -312,43 +503,35 @@ class SQLiteDatabase(Database):
                 return [dict(row) for row in rows]
             return None
 
-    async def search_repositories(
+    def _build_repo_filters(
         self,
         categories: Optional[List[str]] = None,
         languages: Optional[List[str]] = None,
         min_stars: Optional[int] = None,
         max_stars: Optional[int] = None,
-        limit: int = 10,
-        offset: int = 0,
-        # New filter dimensions
         is_active: Optional[bool] = None,
         is_new: Optional[bool] = None,
         owner_type: Optional[str] = None,
         exclude_archived: bool = True,
-        is_deleted: Optional[bool] = False,
-        # Sorting
-        sort_by: Optional[str] = None,
-        sort_order: str = "DESC",
-        # Return total count
-        return_count: bool = False
-    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
-        """Search repositories with filters
+        is_deleted: Optional[bool] = False
+    ) -> Tuple[List[str], List[Any]]:
+        """Build WHERE conditions and params for repository filters.
+
+        Conditions reference the repositories table as ``r``.
 
         Returns:
-            If return_count is True: {"results": [...], "total": int}
-            Otherwise: List of matching repositories
+            Tuple of (conditions, params)
         """
-        from datetime import datetime, timedelta
-
-        query = "SELECT DISTINCT r.* FROM repositories r"
         conditions = []
         params = []
+        # One reference time for all relative cutoffs
+        now = datetime.now(timezone.utc)
 
-        # Join with categories if filtering
         if categories:
-            query += " JOIN repo_categories rc ON r.id = rc.repo_id"
             placeholders = ",".join(["?" for _ in categories])
-            conditions.append(f"rc.category IN ({placeholders})")
+            conditions.append(
+                f"r.id IN (SELECT repo_id FROM repo_categories WHERE category IN ({placeholders}))"
+            )
             params.extend(categories)
 
         if languages:
@@ -367,14 +550,14 @@ class SQLiteDatabase(Database):
         # New filter dimensions
         if is_active:
             # Active: pushed within last 7 days
-            seven_days_ago = (datetime.utcnow() - timedelta(days=7)).isoformat()
-            conditions.append("r.pushed_at >= ?")
+            seven_days_ago = int((now - timedelta(days=7)).timestamp())
+            conditions.append(f"{PUSHED_AT_EPOCH} >= ?")
             params.append(seven_days_ago)
 
         if is_new:
             # New: created within last 6 months
-            six_months_ago = (datetime.utcnow() - timedelta(days=180)).isoformat()
-            conditions.append("r.created_at >= ?")
+            six_months_ago = int((now - timedelta(days=180)).timestamp())
+            conditions.append(f"{CREATED_AT_EPOCH} >= ?")
             params.append(six_months_ago)
 
         if owner_type:
@@ -389,20 +572,88 @@ class SQLiteDatabase(Database):
             conditions.append("r.is_deleted = ?")
             params.append(1 if is_deleted else 0)
 
+        return conditions, params
+
+    async def search_repositories(
+        self,
+        categories: Optional[List[str]] = None,
+        languages: Optional[List[str]] = None,
+        min_stars: Optional[int] = None,
+        max_stars: Optional[int] = None,
+        limit: int = 10,
+        offset: int = 0,
+        # New filter dimensions
+        is_active: Optional[bool] = None,
+        is_new: Optional[bool] = None,
+        owner_type: Optional[str] = None,
+        exclude_archived: bool = True,
+        is_deleted: Optional[bool] = False,
+        # Sorting
+        sort_by: Optional[str] = None,
+        sort_order: str = "DESC",
+        # Return total count
+        return_count: bool = False,
+        # Keyset pagination cursor: (sort value, name_with_owner) of the last row seen
+        after: Optional[Tuple[Any, str]] = None,
+        # Repository to leave out of the results (e.g. the source of a similarity lookup)
+        exclude_name_with_owner: Optional[str] = None
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """Search repositories with filters
+
+        Pass ``after`` (e.g. the previous page's ``next_cursor``) instead of
+        ``offset`` to seek directly to the next page via the sort index.
+
+        Returns:
+            If return_count is True: {"results": [...], "total": int, "next_cursor": tuple | None}
+            Otherwise: List of matching repositories
+        """
+        conditions, params = self._build_repo_filters(
+            categories=categories,
+            languages=languages,
+            min_stars=min_stars,
+            max_stars=max_stars,
+            is_active=is_active,
+            is_new=is_new,
+            owner_type=owner_type,
+            exclude_archived=exclude_archived,
+            is_deleted=is_deleted
+        )
+
+        if exclude_name_with_owner:
+            conditions.append("r.name_with_owner != ?")
+            params.append(exclude_name_with_owner)
+
+        # Sorting
+        valid_sort_fields = {"starred_at", "stargazer_count", "last_synced_at", "pushed_at", "created_at", "name"}
+        sort_column = sort_by if sort_by in valid_sort_fields else "starred_at"
+        sort_field = f"r.{sort_column}"
+        direction = sort_order if sort_order in ('ASC', 'DESC') else 'DESC'
+
+        count_conditions = list(conditions)
+        count_params = list(params)
+
+        if after is not None:
+            after_value, after_name = after
+            seek_condition, seek_params = self._build_seek_condition(
+                sort_field, direction, after_value, after_name
+            )
+            conditions.append(seek_condition)
+            params.extend(seek_params)
+            offset = 0
+
+        # Without a cursor the page and the total share one predicate, so the
+        # count comes from a window function over the same scan
+        window_count = return_count and after is None
+        if window_count:
+            query = "SELECT r.*, COUNT(*) OVER () AS _total FROM repositories r"
+        else:
+            query = "SELECT r.* FROM repositories r"
+
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
 
-        # Sorting
-        valid_sort_fields = {
-            "starred_at": "r.starred_at",
-            "stargazer_count": "r.stargazer_count",
-            "last_synced_at": "r.last_synced_at",
-            "pushed_at": "r.pushed_at",
-            "created_at": "r.created_at",
-            "name": "r.name"
-        }
-        sort_field = valid_sort_fields.get(sort_by, "r.starred_at")
-        query += f" ORDER BY {sort_field} {sort_order if sort_order in ('ASC', 'DESC') else 'DESC'}"
+        # name_with_owner breaks ties so the cursor is unique
+        query += f" ORDER BY {sort_field} {direction}, r.name_with_owner {direction}"
         query += " LIMIT ? OFFSET ?"
         params.append(limit)
         params.append(offset)
@@ -413,36 +664,142 @@ class SQLiteDatabase(Database):
 
         # Return total count if requested
         if return_count:
-            # Build COUNT query with same conditions
-            count_query = "SELECT COUNT(DISTINCT r.id) as total FROM repositories r"
-            if categories:
-                count_query += " JOIN repo_categories rc ON r.id = rc.repo_id"
+            if window_count and (results or offset == 0):
+                total = results[0]["_total"] if results else 0
+                for result in results:
+                    del result["_total"]
+            else:
+                # Cursor pages (or pages past the end) need the full count
+                count_query = "SELECT COUNT(*) as total FROM repositories r"
+                if count_conditions:
+                    count_query += " WHERE " + " AND ".join(count_conditions)
 
-            if conditions:
-                count_query += " WHERE " + " AND ".join(conditions)
+                async with self._connection.execute(count_query, count_params) as cursor:
+                    count_row = await cursor.fetchone()
+                    total = count_row[0] if count_row else 0
 
-            async with self._connection.execute(count_query, params[:-2]) as cursor:  # Exclude LIMIT and OFFSET params
-                count_row = await cursor.fetchone()
-                total = count_row[0] if count_row else 0
+            next_cursor = None
+            if results and len(results) == limit:
+                last = results[-1]
+                next_cursor = (last.get(sort_column), last["name_with_owner"])
 
-            return {"results": results, "total": total}
+            return {"results": results, "total": total, "next_cursor": next_cursor}
 
         return results
 
+    @staticmethod
+    def _build_seek_condition(
+        sort_field: str,
+        direction: str,
+        after_value: Any,
+        after_name: str
+    ) -> Tuple[str, List[Any]]:
+        """Build the keyset condition for rows after (after_value, after_name).
+
+        NULL-safe for SQLite ordering, where NULLs sort first in ASC and
+        last in DESC.
+
+        Returns:
+            Tuple of (condition, params)
+        """
+        if direction == "DESC":
+            if after_value is None:
+                return f"({sort_field} IS NULL AND r.name_with_owner < ?)", [after_name]
+            return (
+                f"({sort_field} < ? OR ({sort_field} = ? AND r.name_with_owner < ?)"
+                f" OR {sort_field} IS NULL)",
+                [after_value, after_value, after_name]
+            )
+
+        if after_value is None:
+            return (
+                f"({sort_field} IS NOT NULL OR r.name_with_owner > ?)",
+                [after_name]
+            )
+        return (
+            f"({sort_field} > ? OR ({sort_field} = ? AND r.name_with_owner > ?))",
+            [after_value, after_value, after_name]
+        )
+
+    async def filter_repository_names(
+        self,
+        names: List[str],
+        categories: Optional[List[str]] = None,
+        languages: Optional[List[str]] = None,
+        min_stars: Optional[int] = None,
+        max_stars: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        is_new: Optional[bool] = None,
+        owner_type: Optional[str] = None,
+        exclude_archived: bool = True
+    ) -> List[str]:
+        """Keep only the repositories that match the given filters.
+
+        Used to filter ranked search results in SQL instead of Python.
+
+        Args:
+            names: Candidate repository names (owner/repo)
+
+        Returns:
+            Matching names, in the order of ``names``
+        """
+        conditions, filter_params = self._build_repo_filters(
+            categories=categories,
+            languages=languages,
+            min_stars=min_stars,
+            max_stars=max_stars,
+            is_active=is_active,
+            is_new=is_new,
+            owner_type=owner_type,
+            exclude_archived=exclude_archived,
+            is_deleted=None
+        )
+
+        matched = set()
+        for start in range(0, len(names), MAX_IN_PARAMS):
+            chunk = names[start:start + MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            query = (
+                "SELECT r.name_with_owner FROM repositories r "
+                f"WHERE r.name_with_owner IN ({placeholders})"
+            )
+            if conditions:
+                query += " AND " + " AND ".join(conditions)
+
+            async with self._connection.execute(query, [*chunk, *filter_params]) as cursor:
+                matched.update(row[0] for row in await cursor.fetchall())
+
+        return [name for name in names if name in matched]
+
     async def search_repositories_fulltext(
         self,
         query: str,
         limit: int = 20,
         offset: int = 0,
-        return_count: bool = False
+        return_count: bool = False,
+        categories: Optional[List[str]] = None,
+        languages: Optional[List[str]] = None,
+        min_stars: Optional[int] = None,
+        max_stars: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        is_new: Optional[bool] = None,
+        owner_type: Optional[str] = None,
+        exclude_archived: bool = False
     ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Full-text search using FTS5
 
+        The MATCH runs in an isolated CTE so the planner always drives the
+        query from the FTS5 index; filters are applied to the ranked matches.
+        Without filters the CTE stops at the requested page. With filters it
+        keeps every match, so the page and the count use the same predicate.
+
         Args:
             query: Search query string
             limit: Maximum number of results
             offset: Number of results to skip
             return_count: Whether to return total count with results
+            categories, languages, min_stars, max_stars, is_active, is_new,
+            owner_type, exclude_archived: Same filters as search_repositories
 
         Returns:
             If return_count is True: {"results": [...], "total": int}
@@ -453,26 +810,54 @@ class SQLiteDatabase(Database):
                 return {"results": [], "total": 0}
             return []
 
+        conditions, filter_params = self._build_repo_filters(
+            categories=categories,
+            languages=languages,
+            min_stars=min_stars,
+            max_stars=max_stars,
+            is_active=is_active,
+            is_new=is_new,
+            owner_type=owner_type,
+            exclude_archived=exclude_archived,
+            is_deleted=None
+        )
+        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+
         # First get total count if requested
         total = None
         if return_count:
             async with self._connection.execute(
-                """SELECT COUNT(*) FROM repositories r
-                   INNER JOIN repositories_fts fts ON r.rowid = fts.rowid
-                   WHERE repositories_fts MATCH ?""",
-                (query,)
+                f"""WITH fts_matches AS (
+                       SELECT rowid FROM repositories_fts
+                       WHERE repositories_fts MATCH ?
+                   )
+                   SELECT COUNT(*) FROM fts_matches fm
+                   INNER JOIN repositories r ON r.rowid = fm.rowid{where}""",
+                (query, *filter_params)
             ) as cursor:
                 count_row = await cursor.fetchone()
                 total = count_row[0] if count_row else 0
 
-        # Get paginated results with BM25 scores
+        # Unfiltered, only the top limit + offset matches can reach the page;
+        # filtered rows may rank anywhere, so the CTE must not be capped
+        if conditions:
+            cte_limit, cte_params = "", ()
+        else:
+            cte_limit, cte_params = "\n                   LIMIT ?", (limit + offset,)
+
+        # Get paginated results with column-weighted BM25 scores
         async with self._connection.execute(
-            """SELECT r.*, bm25(repositories_fts) as fts_score FROM repositories r
-               INNER JOIN repositories_fts fts ON r.rowid = fts.rowid
-               WHERE repositories_fts MATCH ?
-               ORDER BY fts_score
+            f"""WITH fts_matches AS (
+                   SELECT rowid, {FTS_BM25_RANK} AS fts_score
+                   FROM repositories_fts
+                   WHERE repositories_fts MATCH ?
+                   ORDER BY fts_score{cte_limit}
+               )
+               SELECT r.*, fm.fts_score FROM fts_matches fm
+               INNER JOIN repositories r ON r.rowid = fm.rowid{where}
+               ORDER BY fm.fts_score
                LIMIT ? OFFSET ?""",
-            (query, limit, offset)
+            (query, *cte_params, *filter_params, limit, offset)
         ) as cursor:
             rows = await cursor.fetchall()
             results = [self._row_to_dict(row) for row in rows]
@@ -488,17 +873,8 @@ class SQLiteDatabase(Database):
     ) -> bool:
         """Update an existing repository"""
         try:
-            set_clauses = []
-            params = []
-
-            for key, value in updates.items():
-                if key in ["categories", "features", "use_cases", "topics", "languages"]:
-                    set_clauses.append(f"{key} = ?")
-                    params.append(json.dumps(value, ensure_ascii=False))
-                else:
-                    set_clauses.append(f"{key} = ?")
-                    params.append(value)
-
+            set_clauses = [f"{key} = ?" for key in updates]
+            params = self._update_params(updates)
             params.append(name_with_owner)
 
             await self._connection.execute(
@@ -511,10 +887,85 @@ class SQLiteDatabase(Database):
             print(f"Error updating repository: {e}")
             return False
 
+    async def update_repositories_bulk(
+        self,
+        updates: List[Tuple[str, Dict[str, Any]]]
+    ) -> int:
+        """Update many repositories in a single transaction.
+
+        Rows that set the same columns share one executemany. If the batch
+        fails it is rolled back and retried row by row.
+
+        Args:
+            updates: (name_with_owner, fields to update) pairs
+
+        Returns:
+            Number of repositories updated
+        """
+        if not updates:
+            return 0
+
+        groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for name_with_owner, fields in updates:
+            params = self._update_params(fields)
+            params.append(name_with_owner)
+            groups.setdefault(tuple(fields), []).append(params)
+
+        try:
+            for columns, rows in groups.items():
+                set_clauses = ", ".join(f"{key} = ?" for key in columns)
+                await self._connection.executemany(
+                    f"UPDATE repositories SET {set_clauses} WHERE name_with_owner = ?",
+                    rows
+                )
+            await self._connection.commit()
+            return len(updates)
+        except Exception as e:
+            await self._connection.rollback()
+            print(f"Error updating repositories, retrying per row: {e}")
+            updated = 0
+            for name_with_owner, fields in updates:
+                if await self.update_repository(name_with_owner, fields):
+                    updated += 1
+            return updated
+
+    def _update_params(self, updates: Dict[str, Any]) -> List[Any]:
+        """Build UPDATE parameters, encoding JSON columns"""
+        return [
+            _dump_json(value) if key in JSON_COLUMNS else value
+            for key, value in updates.items()
+        ]
+
     async def delete_repository(self, name_with_owner: str) -> bool:
         """Delete a repository."""
         return await self._delete_entity("repositories", "name_with_owner", name_with_owner)
 
+    async def delete_repositories(self, names: List[str]) -> int:
+        """Delete several repositories in one transaction.
+
+        Args:
+            names: Repository names (owner/repo)
+
+        Returns:
+            Number of repositories deleted
+        """
+        names = list(dict.fromkeys(names))
+        deleted = 0
+        try:
+            for start in range(0, len(names), MAX_IN_PARAMS):
+                chunk = names[start:start + MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await self._connection.execute(
+                    f"DELETE FROM repositories WHERE name_with_owner IN ({placeholders})",
+                    chunk
+                )
+                deleted += cursor.rowcount
+        except Exception:
+            await self._connection.rollback()
+            raise
+        await self._connection.commit()
+        return deleted
+
     # ==================== Conversation Operations ====================
 
     async def create_conversation(self, session_id: str) -> int:
@@ -1024,10 +1475,10 @@ class SQLiteDatabase(Database):
         """Convert database row to dictionary"""
         d = dict(row)
         # Parse JSON fields
-        for key in ["categories", "features", "use_cases", "topics", "languages"]:
+        for key in JSON_COLUMNS:
             if key in d and d[key]:
                 try:
-                    d[key] = json.loads(d[key])
+                    d[key] = orjson.loads(d[key])
                 except:
                     d[key] = []
         return d
@@ -1117,6 +1568,52 @@ class SQLiteDatabase(Database):
 
         return await self.fetch_all(query, tuple(params))
 
+    async def get_graph_edges_bulk(
+        self,
+        repos: List[str],
+        edge_types: Optional[List[str]] = None,
+        limit: int = 50
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the top edges for several repositories in one query.
+
+        Args:
+            repos: Source repository names
+            edge_types: Optional edge types to include
+            limit: Maximum edges per source repository
+
+        Returns:
+            Mapping of source repo to its edges, ordered by weight DESC
+        """
+        edges: Dict[str, List[Dict[str, Any]]] = {repo: [] for repo in repos}
+        if not repos:
+            return edges
+
+        placeholders = ','.join('?' * len(repos))
+        query = f"""
+            SELECT source_repo, target_repo, edge_type, weight, metadata
+            FROM (
+                SELECT source_repo, target_repo, edge_type, weight, metadata,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY source_repo ORDER BY weight DESC
+                       ) AS rank
+                FROM graph_edges
+                WHERE source_repo IN ({placeholders})
+        """
+        params = list(repos)
+
+        if edge_types:
+            type_placeholders = ','.join('?' * len(edge_types))
+            query += f" AND edge_type IN ({type_placeholders})"
+            params.extend(edge_types)
+
+        query += ") WHERE rank <= ? ORDER BY source_repo, rank"
+        params.append(limit)
+
+        for edge in await self.fetch_all(query, tuple(params)):
+            edges[edge["source_repo"]].append(edge)
+
+        return edges
+
     async def delete_repo_edges(self, repo: str) -> None:
         """Delete all edges for a repository (when unstarred)."""
         await self.execute(
@@ -3,10 +3,17 @@ Base GitHub client with shared functionality.
 
 Provides common utilities for both REST and GraphQL clients.
 """
+import time
 import httpx
 from typing import Optional, Dict, Any
 from src.config import settings
 
+# Longest rate-limit reset we wait out before giving up on a request (seconds)
+RATE_LIMIT_MAX_WAIT = 60.0
+
+# Below this many remaining points, requests are paced over the reset window
+RATE_LIMIT_LOW_WATER = 100
+
 
 class GitHubBaseClient:
     """Base client with shared HTTP functionality."""
@@ -60,6 +67,60 @@ class GitHubBaseClient:
             await self._client.aclose()
             self._client = None
 
+    def _rate_limit_wait(self, response: httpx.Response) -> Optional[float]:
+        """
+        Seconds to wait before retrying a rate-limited response.
+
+        Uses Retry-After (secondary rate limits) or X-RateLimit-Reset when the
+        primary limit is exhausted.
+
+        Returns:
+            Wait time, or None if the response is not rate limited or the
+            reset is further away than RATE_LIMIT_MAX_WAIT
+        """
+        if response.status_code not in (403, 429):
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                return None
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                wait = float(response.headers["X-RateLimit-Reset"]) - time.time()
+            except (KeyError, ValueError):
+                return None
+        else:
+            return None
+
+        wait = max(wait, 1.0)
+        return wait if wait <= RATE_LIMIT_MAX_WAIT else None
+
+    def _throttle_wait(self, response: httpx.Response) -> Optional[float]:
+        """
+        Seconds to pause after a successful response to stay under the limit.
+
+        Once X-RateLimit-Remaining drops below RATE_LIMIT_LOW_WATER, the time
+        left until X-RateLimit-Reset is spread evenly over the remaining
+        points, so a long pagination slows down instead of hitting a 403.
+
+        Returns:
+            Pause in seconds (at most RATE_LIMIT_MAX_WAIT), or None when the
+            budget is healthy or the headers are missing
+        """
+        try:
+            remaining = int(response.headers["X-RateLimit-Remaining"])
+            reset_in = float(response.headers["X-RateLimit-Reset"]) - time.time()
+        except (KeyError, ValueError):
+            return None
+
+        if remaining >= RATE_LIMIT_LOW_WATER or reset_in <= 0:
+            return None
+
+        return min(reset_in / (remaining + 1), RATE_LIMIT_MAX_WAIT)
+
     def _check_client(self) -> None:
         """Raise error if client not initialized."""
         if not self._client:
@@ -4,6 +4,7 @@ GitHub GraphQL API client with async support.
 Provides efficient access to GitHub data using GraphQL queries.
 """
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 import asyncio
 import httpx
 from src.github.base import GitHubBaseClient
@@ -52,9 +53,19 @@ class GitHubGraphQLClient(GitHubBaseClient):
                 if "errors" in data:
                     raise Exception(f"GraphQL error: {data['errors']}")
 
+                pause = self._throttle_wait(response)
+                if pause:
+                    print(f"GraphQL rate limit running low, pausing {pause:.1f}s...")
+                    await asyncio.sleep(pause)
+
                 return data.get("data", {})
 
             except httpx.HTTPStatusError as e:
+                wait_time = self._rate_limit_wait(e.response)
+                if wait_time is not None and attempt < max_retries - 1:
+                    print(f"GraphQL rate limited (attempt {attempt + 1}/{max_retries}), retrying in {wait_time:.0f}s...")
+                    await asyncio.sleep(wait_time)
+                    continue
                 if e.response.status_code in (502, 503, 504) and attempt < max_retries - 1:
                     # Exponential backoff: 2s, 4s, 8s
                     wait_time = 2 ** (attempt + 1)
@@ -75,7 +86,8 @@ class GitHubGraphQLClient(GitHubBaseClient):
     async def get_starred_repositories(
         self,
         username: str,
-        max_results: Optional[int] = None
+        max_results: Optional[int] = None,
+        since: Optional[datetime] = None
     ) -> List[GitHubRepository]:
         """
         Get all starred repositories using GraphQL.
@@ -83,6 +95,8 @@ class GitHubGraphQLClient(GitHubBaseClient):
         Args:
             username: GitHub username
             max_results: Maximum number of repositories to fetch
+            since: Only return repositories starred after this time. Stars are
+                listed newest first, so paging stops at the first older star.
 
         Returns:
             List of repositories
@@ -144,6 +158,7 @@ class GitHubGraphQLClient(GitHubBaseClient):
         repos = []
         cursor = None
         page_size = 30  # Reduced from 100 to avoid timeouts
+        reached_since = False
 
         while True:
             variables = {
@@ -207,10 +222,14 @@ class GitHubGraphQLClient(GitHubBaseClient):
                     readme_content=readme_content
                 )
 
+                if since and repo.starred_at and repo.starred_at <= since:
+                    reached_since = True
+                    break
+
                 repos.append(repo)
 
             page_info = page_data.get("pageInfo", {})
-            if not page_info.get("hasNextPage"):
+            if reached_since or not page_info.get("hasNextPage"):
                 break
 
             cursor = page_info.get("endCursor")
@@ -4,6 +4,7 @@ Pydantic models for GitHub API data.
 from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Optional, List, Union, Any, Dict
 from datetime import datetime
+from functools import cached_property
 
 
 class LanguageInfo(BaseModel):
@@ -106,6 +107,26 @@ class GitHubRepository(BaseModel):
         """Extract owner login from full_name"""
         return self.name_with_owner.split("/")[0]
 
+    @cached_property
+    def languages_dump(self) -> List[Dict[str, Any]]:
+        """languages as plain dicts (dumped once per instance)"""
+        return [lang.model_dump() for lang in self.languages]
+
+    @cached_property
+    def pushed_at_iso(self) -> Optional[str]:
+        """pushed_at as an ISO string (formatted once per instance)"""
+        return self.pushed_at.isoformat() if self.pushed_at else None
+
+    @cached_property
+    def created_at_iso(self) -> Optional[str]:
+        """created_at as an ISO string (formatted once per instance)"""
+        return self.created_at.isoformat() if self.created_at else None
+
+    @cached_property
+    def starred_at_iso(self) -> Optional[str]:
+        """starred_at as an ISO string (formatted once per instance)"""
+        return self.starred_at.isoformat() if self.starred_at else None
+
 
 class GitHubUser(BaseModel):
     """GitHub user model"""
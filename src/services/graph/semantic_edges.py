@@ -10,6 +10,8 @@ class SemanticEdgeDiscovery:
 
     DEFAULT_TOP_K = 10
     DEFAULT_MIN_SIMILARITY = 0.6
+    # Repos per DELETE statement (each name is bound twice)
+    DELETE_BATCH_SIZE = 500
 
     def __init__(self, semantic_search, db):
         """Initialize semantic edge discovery service.
@@ -81,19 +83,48 @@ class SemanticEdgeDiscovery:
             top_k: Number of similar repos to find
             min_similarity: Minimum similarity score
         """
+        await self.update_edges_for_repos([repo_name], top_k, min_similarity)
+
+    async def update_edges_for_repos(
+        self,
+        repo_names: List[str],
+        top_k: int = DEFAULT_TOP_K,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY
+    ) -> None:
+        """Update semantic edges for several repositories in one pass.
+
+        Old edges of all repos are deleted with chunked IN queries and the new
+        edges are written with a single batch insert, instead of two
+        statements per repo.
+
+        Args:
+            repo_names: Repository identifiers
+            top_k: Number of similar repos to find
+            min_similarity: Minimum similarity score
+        """
+        if not repo_names:
+            return
+
         try:
-            await self.db.execute_query(
-                "DELETE FROM graph_edges WHERE edge_type = 'semantic' AND (source_repo = ? OR target_repo = ?)",
-                (repo_name, repo_name)
-            )
+            for i in range(0, len(repo_names), self.DELETE_BATCH_SIZE):
+                chunk = repo_names[i:i + self.DELETE_BATCH_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                await self.db.execute_query(
+                    f"""DELETE FROM graph_edges WHERE edge_type = 'semantic'
+                        AND (source_repo IN ({placeholders}) OR target_repo IN ({placeholders}))""",
+                    (*chunk, *chunk)
+                )
+
+            edges = []
+            for repo_name in repo_names:
+                edges.extend(await self._find_edges(repo_name, top_k, min_similarity))
 
-            edges = await self._find_edges(repo_name, top_k, min_similarity)
             if edges:
                 await self.db.batch_insert_graph_edges(edges)
-                logger.info(f"Updated semantic edges for {repo_name}: {len(edges)} edges created")
+            logger.info(f"Updated semantic edges for {len(repo_names)} repos: {len(edges)} edges created")
 
         except Exception as e:
-            logger.warning(f"Failed to update semantic edges for {repo_name}: {e}")
+            logger.warning(f"Failed to update semantic edges for {len(repo_names)} repos: {e}")
 
     async def _find_edges(
         self,
@@ -33,7 +33,9 @@ class HybridSearch:
         self,
         query: str,
         keywords: str | None = None,
-        top_k: int = 10
+        top_k: int = 10,
+        exclude_archived: bool = False,
+        languages: list[str] | None = None
     ) -> list[dict]:
         """Hybrid search with query expansion.
 
@@ -41,6 +43,10 @@ class HybridSearch:
             query: Search query
             keywords: Optional keywords for FTS
             top_k: Number of results to return
+            exclude_archived: Drop archived repos from the candidates before
+                the top-k cut
+            languages: Restrict semantic candidates to these primary languages
+                (pushed into the vector store query as a metadata filter)
 
         Returns:
             List of search results
@@ -50,6 +56,8 @@ class HybridSearch:
         expander = QueryExpander()
         expanded_queries = await expander.expand(query)
 
+        where = {"primary_language": {"$in": languages}} if languages else None
+
         seen_repos = {}
         all_results = []
 
@@ -58,7 +66,7 @@ class HybridSearch:
 
             fts_task = self._fts_search(search_term, top_k * 2)
             semantic_task = (
-                self._semantic_search(expanded_query, top_k * 2)
+                self._semantic_search(expanded_query, top_k * 2, where)
                 if self.semantic
                 else asyncio.sleep(0)
             )
@@ -75,6 +83,12 @@ class HybridSearch:
             if not isinstance(semantic_results, Exception) and semantic_results:
                 self._merge_scores(all_results, seen_repos, semantic_results, "semantic")
 
+        if exclude_archived and seen_repos:
+            kept = set(await self.db.filter_repository_names(
+                list(seen_repos), exclude_archived=True
+            ))
+            seen_repos = {name: item for name, item in seen_repos.items() if name in kept}
+
         results = self._get_top_k(seen_repos, top_k)
 
         if results:
@@ -211,10 +225,18 @@ class HybridSearch:
         except Exception:
             return []
 
-    async def _semantic_search(self, query: str, top_k: int) -> list[dict]:
+    async def _semantic_search(
+        self,
+        query: str,
+        top_k: int,
+        where: dict | None = None
+    ) -> list[dict]:
         """Perform semantic search."""
         if self.semantic:
-            results = await self.semantic.search(query, top_k=top_k)
+            if where:
+                results = await self.semantic.search(query, top_k=top_k, where=where)
+            else:
+                results = await self.semantic.search(query, top_k=top_k)
             for result in results:
                 if "match_type" not in result:
                     result["match_type"] = "semantic"
@@ -237,6 +259,11 @@ class HybridSearch:
         if self.semantic:
             await self.semantic.delete_repository(name_with_owner)
 
+    async def delete_repositories(self, names: list[str]) -> None:
+        """Delete several repositories from vector store in one call."""
+        if self.semantic:
+            await self.semantic.delete_repositories(names)
+
     async def get_similar_repos(self, repo_name: str, top_k: int = 10) -> list[dict]:
         """Find repositories similar to a given repository."""
         if self.semantic:
@@ -1,9 +1,25 @@
 from typing import Any
+import asyncio
 import json
 from datetime import datetime
+
+import numpy as np
+import orjson
+
 from src.db import Database
 from src.vector.semantic import SemanticSearch
 
+# Scale for symmetric int8 quantization of L2-normalized embeddings.
+# Normalized components lie in [-1, 1], so 127 uses the full int8 range.
+INT8_SCALE = 127.0
+
+# Star count at which the heatmap color saturates to red
+COLOR_MAX_STARS = 10000
+# Heatmap colors indexed by hue bucket: 0 (green) .. 120 (red)
+STAR_COLORS: tuple[str, ...] = tuple(
+    f"hsl({120 - bucket}, 70%, 50%)" for bucket in range(121)
+)
+
 
 class NetworkService:
     """Service for building and managing repository relationship networks."""
@@ -22,6 +38,11 @@ class NetworkService:
 
         J(A,B) = |A ∩ B| / |A ∪ B|
         """
+        return self._jaccard(repo_a, repo_b)
+
+    @staticmethod
+    def _jaccard(repo_a: dict[str, Any], repo_b: dict[str, Any]) -> float:
+        """Synchronous Jaccard similarity of two repositories' categories."""
         cats_a = set(repo_a.get("categories", []))
         cats_b = set(repo_b.get("categories", []))
 
@@ -81,6 +102,11 @@ class NetworkService:
         category_sim = await self.calculate_category_similarity(repo_a, repo_b)
         semantic_sim = await self.calculate_semantic_similarity(repo_a, repo_b)
 
+        return self._combine_similarity(category_sim, semantic_sim)
+
+    @staticmethod
+    def _combine_similarity(category_sim: float, semantic_sim: float) -> float:
+        """Combine category and semantic similarity with equal weight."""
         # Weighted combination: 50% category + 50% semantic
         # If semantic is unavailable, effectively 100% category
         if semantic_sim == 0.0:
@@ -88,6 +114,63 @@ class NetworkService:
 
         return 0.5 * category_sim + 0.5 * semantic_sim
 
+    def _load_embeddings(self, names: list[str]) -> np.ndarray | None:
+        """
+        Load stored embeddings for the given repositories.
+
+        Returns an (N, d) float32 matrix aligned with ``names`` (zero rows for
+        repositories without an embedding), or None if unavailable.
+        """
+        if not self.semantic:
+            return None
+
+        try:
+            result = self.semantic.collection.get(ids=names, include=["embeddings"])
+        except Exception:
+            # Fall back to category-only similarity
+            return None
+
+        ids = result.get("ids") or []
+        embeddings = result.get("embeddings")
+        if not ids or embeddings is None or len(embeddings) == 0:
+            return None
+
+        index = {name: i for i, name in enumerate(names)}
+        matrix = np.zeros((len(names), len(embeddings[0])), dtype=np.float32)
+        for repo_id, vector in zip(ids, embeddings):
+            if repo_id in index:
+                matrix[index[repo_id]] = vector
+
+        return matrix
+
+    @staticmethod
+    def _quantize_embeddings(matrix: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize embeddings and quantize them to int8.
+
+        Keeps the in-memory matrix 4x smaller than float32 for the
+        pairwise cosine computation.
+        """
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        normalized = np.divide(
+            matrix, norms, out=np.zeros_like(matrix), where=norms > 0
+        )
+        return np.round(normalized * INT8_SCALE).astype(np.int8)
+
+    @staticmethod
+    def _semantic_matrix(quantized: np.ndarray) -> np.ndarray:
+        """
+        Compute pairwise cosine similarity from int8-quantized embeddings.
+
+        Dot products accumulate in int32 and are rescaled by 1/s².
+        Negative similarities and the diagonal are clamped to 0.
+        """
+        dots = np.einsum("ij,kj->ik", quantized, quantized, dtype=np.int32)
+        similarity = dots.astype(np.float32) / (INT8_SCALE * INT8_SCALE)
+        np.clip(similarity, 0.0, 1.0, out=similarity)
+        np.fill_diagonal(similarity, 0.0)
+        return similarity
+
     async def build_network(
         self,
         top_n: int = 100,
@@ -160,37 +243,120 @@ class NetworkService:
                 "language": repo.get("primary_language", "Unknown")
             })
 
+        # The blocking embedding lookup and the CPU-bound pairwise similarity
+        # and top-k selection both run in the default thread pool
+        loop = asyncio.get_running_loop()
+        edges = await loop.run_in_executor(None, self._build_edges, repos, k)
+
+        return {"nodes": nodes, "edges": edges}
+
+    @staticmethod
+    def _jaccard_matrix(repos: list[dict[str, Any]]) -> np.ndarray:
+        """
+        Compute pairwise category Jaccard similarity for all repositories.
+
+        Builds a multi-hot (N, C) category matrix so intersections are a
+        single matrix product. The diagonal is 0 (no self-edges).
+        """
+        category_index: dict[str, int] = {}
+        rows, cols = [], []
+        for i, repo in enumerate(repos):
+            for category in set(repo.get("categories", [])):
+                rows.append(i)
+                cols.append(category_index.setdefault(category, len(category_index)))
+
+        jaccard = np.zeros((len(repos), len(repos)), dtype=np.float64)
+
+        # Repos without categories can never share one; leave their rows at 0
+        # and only multiply the categorized sub-matrix
+        categorized = np.unique(np.asarray(rows, dtype=np.intp))
+        if categorized.size < 2:
+            return jaccard
+
+        membership = np.zeros((len(repos), len(category_index)), dtype=np.float64)
+        membership[rows, cols] = 1.0
+        membership = membership[categorized]
+
+        sizes = membership.sum(axis=1)
+        intersection = membership @ membership.T
+        union = sizes[:, None] + sizes[None, :] - intersection
+
+        # Only pairs sharing at least one category get a non-zero score
+        sub = np.divide(
+            intersection, union, out=np.zeros_like(intersection), where=intersection > 0
+        )
+        np.fill_diagonal(sub, 0.0)
+        jaccard[np.ix_(categorized, categorized)] = sub
+        return jaccard
+
+    @staticmethod
+    def _combined_matrix(
+        category: np.ndarray,
+        semantic: np.ndarray | None
+    ) -> np.ndarray:
+        """Matrix form of _combine_similarity."""
+        if semantic is None:
+            return category
+
+        return np.where(semantic == 0.0, category, 0.5 * category + 0.5 * semantic)
+
+    @staticmethod
+    def _top_k_indices(row: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k largest values in row, highest first."""
+        if k < len(row):
+            # O(N) selection, then sort only the k winners
+            candidates = np.argpartition(-row, k)[:k]
+        else:
+            candidates = np.arange(len(row))
+
+        # Order by strength, ties by repository order
+        return candidates[np.lexsort((candidates, -row[candidates]))]
+
+    def _build_edges(self, repos: list[dict[str, Any]], k: int) -> list[dict[str, Any]]:
+        """
+        Load stored embeddings and compute top-k edges.
+
+        Blocking (synchronous Chroma read plus CPU work), so build_network
+        runs it in an executor.
+        """
+        embeddings = self._load_embeddings([repo["name_with_owner"] for repo in repos])
+        return self._compute_edges(repos, embeddings, k)
+
+    def _compute_edges(
+        self,
+        repos: list[dict[str, Any]],
+        embeddings: np.ndarray | None,
+        k: int
+    ) -> list[dict[str, Any]]:
+        """
+        Compute top-k similarity edges for each repository.
+
+        Pure CPU work with no I/O, so build_network runs it in an executor.
+        """
+        # Pairwise semantic similarity from stored embeddings (int8-quantized)
+        semantic = None
+        if embeddings is not None:
+            semantic = self._semantic_matrix(self._quantize_embeddings(embeddings))
+
+        similarity = self._combined_matrix(self._jaccard_matrix(repos), semantic)
+        names = [repo["name_with_owner"] for repo in repos]
+
         # Build edges (top-k for each node)
         edges = []
         seen_edges = set()
-        for i, repo_a in enumerate(repos):
-            similarities = []
-
-            for j, repo_b in enumerate(repos):
-                if i == j:
-                    continue
-
-                sim = await self.calculate_similarity(repo_a, repo_b)
-                similarities.append({
-                    "target": repo_b["name_with_owner"],
-                    "strength": sim
-                })
-
-            # Sort by similarity and take top-k
-            similarities.sort(key=lambda x: x["strength"], reverse=True)
-            top_k = similarities[:k]
-
-            for edge in top_k:
-                edge_key = (repo_a["name_with_owner"], edge["target"])
-                if edge["strength"] > 0 and edge_key not in seen_edges:
+        for i, row in enumerate(similarity):
+            for j in self._top_k_indices(row, k):
+                strength = float(row[j])
+                edge_key = (names[i], names[j])
+                if strength > 0 and edge_key not in seen_edges:
                     seen_edges.add(edge_key)
                     edges.append({
-                        "source": repo_a["name_with_owner"],
-                        "target": edge["target"],
-                        "strength": edge["strength"]
+                        "source": names[i],
+                        "target": names[j],
+                        "strength": strength
                     })
 
-        return {"nodes": nodes, "edges": edges}
+        return edges
 
     def _get_color_by_stars(self, stars: int) -> str:
         """
@@ -198,13 +364,10 @@ class NetworkService:
 
         Green (low) -> Yellow (medium) -> Red (high)
         """
-        # Normalize: 0 to 10000+ stars
-        normalized = min(stars / 10000, 1.0)
+        # Bucket 0 to 10000+ stars into 121 integer hues: 120 (green) -> 0 (red)
+        bucket = min(max(stars, 0) * 120 // COLOR_MAX_STARS, 120)
 
-        # HSL: 120 (green) -> 0 (red)
-        hue = 120 - (normalized * 120)
-
-        return f"hsl({hue}, 70%, 50%)"
+        return STAR_COLORS[bucket]
 
     async def save_network(
         self,
@@ -213,10 +376,10 @@ class NetworkService:
         k: int
     ) -> None:
         """Save network data to cache."""
-        # Serialize with error handling
+        # Serialize column-wise (struct of arrays) with error handling
         try:
-            nodes_json = json.dumps(network["nodes"])
-            edges_json = json.dumps(network["edges"])
+            nodes_json = orjson.dumps(self._to_columns(network["nodes"])).decode()
+            edges_json = orjson.dumps(self._to_columns(network["edges"])).decode()
         except (TypeError, ValueError) as e:
             raise ValueError(f"Network data is not JSON-serializable: {e}")
 
@@ -249,9 +412,9 @@ class NetworkService:
 
         # Deserialize with error handling
         try:
-            nodes = json.loads(nodes_json)
-            edges = json.loads(edges_json)
-        except json.JSONDecodeError:
+            nodes = self._from_columns(orjson.loads(nodes_json))
+            edges = self._from_columns(orjson.loads(edges_json))
+        except orjson.JSONDecodeError:
             # Cache is corrupted, delete it and return None
             await self.db._connection.execute("DELETE FROM network_cache")
             await self.db._connection.commit()
@@ -261,3 +424,26 @@ class NetworkService:
             "nodes": nodes,
             "edges": edges
         }
+
+    @staticmethod
+    def _to_columns(records: list[dict[str, Any]]) -> dict[str, list[Any]]:
+        """
+        Convert a list of records into a dict of parallel column lists.
+
+        Avoids repeating every key per node/edge in the cached JSON.
+        """
+        fields = dict.fromkeys(key for record in records for key in record)
+        return {field: [record.get(field) for record in records] for field in fields}
+
+    @staticmethod
+    def _from_columns(data: dict[str, list[Any]] | list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Convert cached column lists back into a list of records.
+
+        Caches written before the columnar format are already lists of records.
+        """
+        if isinstance(data, list):
+            return data
+
+        fields = list(data)
+        return [dict(zip(fields, values)) for values in zip(*data.values())]
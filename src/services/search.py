@@ -1,8 +1,11 @@
 """
 Service for searching repositories.
 """
-from typing import List, Dict, Any, Optional
+import copy
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
 from src.db import Database
+from src.utils.cache import db_cache_key, db_version, similar_cache, stats_cache
 
 
 class SearchService:
@@ -33,7 +36,8 @@ class SearchService:
         owner_type: Optional[str] = None,
         exclude_archived: bool = True,
         sort_by: str = "starred_at",
-        return_count: bool = False
+        return_count: bool = False,
+        after: Optional[Tuple[Any, str]] = None
     ) -> List[Dict[str, Any]] | Dict[str, Any]:
         """
         Search repositories with filters.
@@ -52,19 +56,26 @@ class SearchService:
             exclude_archived: Exclude archived repos
             sort_by: Sort field
             return_count: Whether to return total count with results
+            after: Keyset cursor from a previous page's ``next_cursor``;
+                used instead of offset
 
         Returns:
-            If return_count is True: {"results": [...], "total": int}
+            If return_count is True: {"results": [...], "total": int, "next_cursor": ...}
             Otherwise: List of matching repositories
         """
         # Use hybrid search if query is provided and hybrid_search is available
         if query and query.strip() and self.hybrid_search:
-            results = await self.hybrid_search.search(query, top_k=limit)
+            # Archived repos are dropped during candidate selection and the
+            # language filter is pushed into the vector search
+            results = await self.hybrid_search.search(
+                query, top_k=limit, exclude_archived=exclude_archived,
+                languages=languages
+            )
 
-            # Apply filters if specified
-            if any([categories, languages, min_stars, max_stars, is_active is not None,
-                    is_new is not None, owner_type, exclude_archived]):
-                results = self._apply_filters(
+            # Apply user-supplied filters if specified
+            if any([categories, languages, min_stars is not None, max_stars is not None,
+                    is_active is not None, is_new is not None, owner_type]):
+                results = await self._apply_filters(
                     results,
                     categories=categories,
                     languages=languages,
@@ -76,13 +87,22 @@ class SearchService:
                     exclude_archived=exclude_archived
                 )
 
-            # Apply offset
-            if offset > 0:
-                results = results[offset:]
+            # Apply cursor or offset with a single slice
+            total = len(results)
+            if after is not None:
+                remaining = self._seek_ranked(results, after)
+                page = remaining[:limit]
+                has_more = len(remaining) > limit
+            else:
+                page = results[offset:offset + limit]
+                has_more = offset + limit < total
 
             if return_count:
-                return {"results": results[:limit], "total": len(results)}
-            return results[:limit]
+                next_cursor = None
+                if has_more and page:
+                    next_cursor = (page[-1].get("final_score"), page[-1]["name_with_owner"])
+                return {"results": page, "total": total, "next_cursor": next_cursor}
+            return page
 
         # Fall back to FTS5 or regular search
         if query and query.strip():
@@ -90,7 +110,15 @@ class SearchService:
                 query=query,
                 limit=limit,
                 offset=offset,
-                return_count=return_count
+                return_count=return_count,
+                categories=categories,
+                languages=languages,
+                min_stars=min_stars,
+                max_stars=max_stars,
+                is_active=is_active,
+                is_new=is_new,
+                owner_type=owner_type,
+                exclude_archived=exclude_archived
             )
 
         return await self.db.search_repositories(
@@ -105,10 +133,35 @@ class SearchService:
             owner_type=owner_type,
             exclude_archived=exclude_archived,
             sort_by=sort_by,
-            return_count=return_count
+            return_count=return_count,
+            after=after
         )
 
-    def _apply_filters(
+    @staticmethod
+    def _seek_ranked(
+        results: List[Dict[str, Any]],
+        after: Tuple[Any, str]
+    ) -> List[Dict[str, Any]]:
+        """Return the ranked results that come after the cursor.
+
+        Args:
+            results: Results ordered by final_score (descending)
+            after: (final_score, name_with_owner) of the last result seen
+
+        Returns:
+            Results following the cursor
+        """
+        after_score, after_name = after
+        for i, repo in enumerate(results):
+            if repo["name_with_owner"] == after_name:
+                return results[i + 1:]
+
+        # Cursor repo no longer ranked; continue below its score
+        if after_score is None:
+            return []
+        return [r for r in results if (r.get("final_score") or 0) < after_score]
+
+    async def _apply_filters(
         self,
         results: List[Dict[str, Any]],
         categories: Optional[List[str]] = None,
@@ -122,6 +175,8 @@ class SearchService:
     ) -> List[Dict[str, Any]]:
         """Apply filters to search results.
 
+        Filtering runs in the database; the ranked order of results is kept.
+
         Args:
             results: Search results to filter
             categories: Filter by categories
@@ -136,58 +191,22 @@ class SearchService:
         Returns:
             Filtered results
         """
-        from datetime import datetime, timedelta
-
-        filtered = []
-        for repo in results:
-            # Exclude archived
-            if exclude_archived and repo.get("archived"):
-                continue
-
-            # Filter by owner type
-            if owner_type and repo.get("owner_type") != owner_type:
-                continue
-
-            # Filter by language
-            if languages and repo.get("primary_language") not in languages:
-                continue
-
-            # Filter by stars
-            stars = repo.get("stargazer_count", 0)
-            if min_stars is not None and stars < min_stars:
-                continue
-            if max_stars is not None and stars > max_stars:
-                continue
-
-            # Filter by active status
-            if is_active is not None:
-                pushed_at = repo.get("pushed_at")
-                if is_active and not pushed_at:
-                    continue
-                if is_active:
-                    try:
-                        pushed_date = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
-                        if pushed_date < datetime.now() - timedelta(days=7):
-                            continue
-                    except (ValueError, AttributeError):
-                        continue
-
-            # Filter by new status
-            if is_new is not None:
-                created_at = repo.get("created_at")
-                if is_new and not created_at:
-                    continue
-                if is_new:
-                    try:
-                        created_date = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                        if created_date < datetime.now() - timedelta(days=180):
-                            continue
-                    except (ValueError, AttributeError):
-                        continue
-
-            filtered.append(repo)
-
-        return filtered
+        if not results:
+            return []
+
+        matched = set(await self.db.filter_repository_names(
+            [repo["name_with_owner"] for repo in results],
+            categories=categories,
+            languages=languages,
+            min_stars=min_stars,
+            max_stars=max_stars,
+            is_active=is_active,
+            is_new=is_new,
+            owner_type=owner_type,
+            exclude_archived=exclude_archived
+        ))
+
+        return [repo for repo in results if repo["name_with_owner"] in matched]
 
     async def search_fulltext(
         self,
@@ -215,7 +234,11 @@ class SearchService:
         Returns:
             Dictionary mapping category to count
         """
-        stats = await self.db.get_statistics()
+        stats = await stats_cache.get_or_set(
+            ("statistics", db_cache_key(self.db)),
+            self.db.get_statistics,
+            version=await db_version(self.db)
+        )
         return stats.get("categories", {})
 
     async def get_languages(self) -> List[str]:
@@ -256,20 +279,35 @@ class SearchService:
         Returns:
             List of similar repositories
         """
+        # Results are cached per (repo, limit) until the data changes or the
+        # entry expires; callers get deep copies (rows hold nested lists such
+        # as categories/topics) so they can't corrupt it
+        cached = await similar_cache.get_or_set(
+            ("similar", db_cache_key(self.db), name_with_owner, limit),
+            lambda: self._find_similar_repositories(name_with_owner, limit),
+            version=await db_version(self.db)
+        )
+        return copy.deepcopy(list(cached))
+
+    async def _find_similar_repositories(
+        self,
+        name_with_owner: str,
+        limit: int
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Query repositories similar to the given one (uncached)."""
         # Get the target repository
         repo = await self.db.get_repository(name_with_owner)
         if not repo:
-            return []
+            return ()
 
-        # Find repos with same categories or language
+        # Find repos with same categories or language, excluding the repo itself
         results = await self.db.search_repositories(
             categories=repo.get("categories", [])[:2],  # Use first 2 categories
             languages=[repo.get("primary_language")] if repo.get("primary_language") else None,
-            limit=limit + 1  # +1 to exclude the repo itself
+            limit=limit,
+            exclude_name_with_owner=name_with_owner
         )
-
-        # Exclude the original repository
-        return [r for r in results if r["name_with_owner"] != name_with_owner][:limit]
+        return tuple(results)
 
     async def search_with_relations(
         self,
@@ -285,7 +323,8 @@ class SearchService:
         owner_type: Optional[str] = None,
         exclude_archived: bool = True,
         sort_by: str = "starred_at",
-        include_related: bool = True
+        include_related: bool = True,
+        after: Optional[Tuple[Any, str]] = None
     ) -> Dict[str, Any]:
         """
         Search repositories with filters and include related recommendations.
@@ -304,9 +343,10 @@ class SearchService:
             exclude_archived: Exclude archived repos
             sort_by: Sort field
             include_related: Whether to include related repo recommendations
+            after: Keyset cursor from a previous page's ``next_cursor``
 
         Returns:
-            Dictionary with "results", "related", and "total" keys
+            Dictionary with "results", "related", "total" and "next_cursor" keys
         """
         search_result = await self.search(
             query=query,
@@ -321,7 +361,8 @@ class SearchService:
             owner_type=owner_type,
             exclude_archived=exclude_archived,
             sort_by=sort_by,
-            return_count=True
+            return_count=True,
+            after=after
         )
 
         results = search_result.get("results", [])
@@ -334,7 +375,8 @@ class SearchService:
         return {
             "results": results,
             "related": related,
-            "total": total
+            "total": total,
+            "next_cursor": search_result.get("next_cursor")
         }
 
     async def _get_related_repositories(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -346,26 +388,21 @@ class SearchService:
         Returns:
             List of related repository data
         """
-        related_repos = set()
+        result_names = {r['name_with_owner'] for r in results}
 
-        # Collect related repos from top 5 results
-        for repo in results[:5]:
-            edges = await self.db.get_graph_edges(
-                repo['name_with_owner'],
-                limit=3
-            )
-            for edge in edges:
-                related_repos.add(edge['target_repo'])
+        # Collect related repos from top 5 results in one query
+        edges_by_repo = await self.db.get_graph_edges_bulk(
+            [repo['name_with_owner'] for repo in results[:5]],
+            limit=3
+        )
 
-        # Remove already shown repos
-        result_names = {r['name_with_owner'] for r in results}
-        related_repos = related_repos - result_names
+        # Remove already shown repos, keeping result rank then edge weight order
+        related_repos = dict.fromkeys(
+            edge['target_repo']
+            for edges in edges_by_repo.values()
+            for edge in edges
+            if edge['target_repo'] not in result_names
+        )
 
         # Fetch full repo data for top 5 related
-        related = []
-        for repo_name in list(related_repos)[:5]:
-            repo_data = await self.db.get_repository(repo_name)
-            if repo_data:
-                related.append(repo_data)
-
-        return related
+        return await self.db.get_repositories(list(islice(related_repos, 5)))
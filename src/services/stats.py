@@ -1,5 +1,6 @@
 """Statistics aggregation service."""
 from src.db import Database
+from src.utils.cache import db_cache_key, db_version, stats_cache
 
 
 class StatsService:
@@ -27,7 +28,15 @@ class StatsService:
             return self._format_overall_stats(data)
 
     async def _stats_by_language(self, db: Database) -> dict:
-        """Get statistics grouped by language."""
+        """Get statistics grouped by language (cached, see stats_cache)."""
+        return await stats_cache.get_or_set(
+            ("language_stats", db_cache_key(db)),
+            lambda: self._query_stats_by_language(db),
+            version=await db_version(db)
+        )
+
+    async def _query_stats_by_language(self, db: Database) -> dict:
+        """Query statistics grouped by language."""
         async with db._connection.execute("""
             SELECT primary_language, COUNT(*) as count
             FROM repositories
@@ -41,7 +50,11 @@ class StatsService:
 
     async def _overall_stats(self, db: Database) -> dict:
         """Get overall statistics."""
-        stats = await db.get_statistics()
+        stats = await stats_cache.get_or_set(
+            ("statistics", db_cache_key(db)),
+            db.get_statistics,
+            version=await db_version(db)
+        )
         return {
             "total": stats.get("total_repositories", 0),
             "with_language": stats.get("repositories_with_primary_language", 0)
@@ -4,13 +4,35 @@ Data synchronization service for GitHub starred repositories.
 Handles sync, change detection, and deletion of repositories.
 """
 import asyncio
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 from typing import Any
 
 from src.github.models import GitHubRepository
 from src.db import Database
 from src.utils import log_info, log_error, log_debug
 
+# Max repositories updated concurrently during a sync
+UPDATE_CONCURRENCY = 32
+
+# Fields compared for light updates, in the order _detect_changes builds GitHub values
+LIGHT_DIFF_FIELDS = (
+    "stargazer_count", "fork_count", "description", "primary_language",
+    "archived", "visibility", "owner_type",
+)
+
+# Per-repo errors shown in the end-of-sync summary (all are kept in stats["errors"])
+ERROR_SUMMARY_LIMIT = 20
+
+# Local columns read by change detection; full rows are fetched only for repos that changed.
+# Only the presence of languages matters, so SQLite reports it as a flag instead of
+# handing back the JSON blob to be parsed.
+SYNC_DIFF_COLUMNS = [
+    "pushed_at", "stargazer_count", "fork_count", "description",
+    "primary_language", "archived", "visibility", "owner_type",
+    "(languages IS NOT NULL AND languages NOT IN ('', '[]')) AS has_languages",
+]
+
 
 class SyncService:
     """Service for synchronizing GitHub starred repositories with local database."""
@@ -30,7 +52,8 @@ class SyncService:
     async def sync(
         self,
         skip_llm: bool = True,
-        force_update: bool = False
+        force_update: bool = False,
+        github_repos: list[GitHubRepository] | None = None
     ) -> dict[str, Any]:
         """Synchronize all starred repositories from GitHub.
 
@@ -45,6 +68,8 @@ class SyncService:
         Args:
             skip_llm: Skip LLM analysis (faster)
             force_update: Force update all repos even if no changes detected
+            github_repos: Already fetched starred repositories; skips the
+                GitHub fetch so one listing can be shared between operations
 
         Returns:
             Statistics about the sync operation
@@ -52,35 +77,33 @@ class SyncService:
         stats = self._init_stats("full")
 
         try:
-            from src.github.graphql import GitHubGraphQLClient
-            import os
+            log_info("Starting sync")
 
-            async with GitHubGraphQLClient() as github:
-                log_info("Starting sync")
+            if github_repos is None:
+                github_repos = await self._fetch_starred_repositories()
+            github_repo_map, stats["last_starred_at"] = self._index_repos(github_repos)
 
-                username = os.getenv("GITHUB_USER")
-                if not username:
-                    user = await github.get_authenticated_user()
-                    username = user.get("login")
-                    if not username:
-                        raise ValueError("Could not get authenticated user. Please set GITHUB_USER environment variable.")
+            local_repo_map = {
+                repo['name_with_owner']: repo
+                async for repo in self.db.iter_repositories(
+                    is_deleted=False, columns=SYNC_DIFF_COLUMNS
+                )
+            }
 
-                github_repos = await github.get_starred_repositories(username)
-                github_repo_map = {repo.name_with_owner: repo for repo in github_repos}
-
-                local_repos = await self.db.search_repositories(is_deleted=False, limit=1000)
-                local_repo_map = {repo['name_with_owner']: repo for repo in local_repos}
-
-                github_names = set(github_repo_map.keys())
-                local_names = set(local_repo_map.keys())
+            # Key views support set algebra without copying the names
+            github_names = github_repo_map.keys()
+            local_names = local_repo_map.keys()
 
+            if not local_names or not github_names:
+                new_names, deleted_names, common_names = set(github_names), set(local_names), set()
+            else:
                 new_names = github_names - local_names
                 deleted_names = local_names - github_names
                 common_names = github_names & local_names
 
-                await self._process_new_repos(github_repo_map, new_names, stats, skip_llm)
-                await self._process_updates(github_repo_map, local_repo_map, common_names, stats, skip_llm, force_update)
-                await self._process_deletions(deleted_names, stats)
+            await self._process_new_repos(github_repo_map, new_names, stats, skip_llm)
+            await self._process_updates(github_repo_map, local_repo_map, common_names, stats, skip_llm, force_update)
+            await self._process_deletions(deleted_names, stats)
 
             # Full sync: rebuild semantic edges
             if force_update and self.semantic_edge_discovery:
@@ -89,6 +112,7 @@ class SyncService:
 
             stats["completed_at"] = datetime.now().isoformat()
             log_info(f"Sync completed: +{stats['added']} ~{stats['updated']} -{stats['deleted']}")
+            self._log_failure_summary(stats)
 
             await self._record_sync_history(stats)
             return stats
@@ -96,6 +120,117 @@ class SyncService:
         except Exception as e:
             return await self._handle_sync_error(stats, e, "Sync")
 
+    async def full_sync(
+        self,
+        skip_llm: bool = True,
+        github_repos: list[GitHubRepository] | None = None
+    ) -> dict[str, Any]:
+        """Re-fetch all starred repositories and reconcile adds, updates and unstars."""
+        return await self.sync(skip_llm=skip_llm, github_repos=github_repos)
+
+    async def incremental_sync(self, skip_llm: bool = True) -> dict[str, Any]:
+        """Add repositories starred since the last successful sync.
+
+        Only stars newer than the starred_at cursor persisted in sync_history
+        are fetched, so the GitHub cost scales with the number of new stars.
+        Unstars and metadata changes are picked up by the next full sync.
+        Falls back to a full sync when no cursor has been recorded yet.
+
+        Args:
+            skip_llm: Skip LLM analysis (faster)
+
+        Returns:
+            Statistics about the sync operation
+        """
+        since = await self._get_last_starred_at()
+        if since is None:
+            log_info("No starred_at cursor recorded yet, running full sync")
+            return await self.full_sync(skip_llm=skip_llm)
+
+        stats = self._init_stats("incremental")
+
+        try:
+            log_info(f"Starting incremental sync (stars after {since.isoformat()})")
+
+            github_repos = await self._fetch_starred_repositories(since=since)
+            github_repo_map, last_starred_at = self._index_repos(github_repos)
+            existing_names = {
+                repo["name_with_owner"]
+                for repo in await self.db.get_repositories(list(github_repo_map))
+            }
+
+            await self._process_new_repos(
+                github_repo_map, github_repo_map.keys() - existing_names, stats, skip_llm
+            )
+
+            stats["last_starred_at"] = last_starred_at or since.isoformat()
+            stats["completed_at"] = datetime.now().isoformat()
+            log_info(f"Incremental sync completed: +{stats['added']}")
+            self._log_failure_summary(stats)
+
+            await self._record_sync_history(stats)
+            return stats
+
+        except Exception as e:
+            return await self._handle_sync_error(stats, e, "Incremental sync")
+
+    async def _fetch_starred_repositories(
+        self,
+        since: datetime | None = None
+    ) -> list[GitHubRepository]:
+        """Fetch the user's starred repositories (optionally only newer than since)."""
+        from src.github.graphql import GitHubGraphQLClient
+
+        async with GitHubGraphQLClient() as github:
+            username = await self._get_username(github)
+            if since is None:
+                return await github.get_starred_repositories(username)
+            return await github.get_starred_repositories(username, since=since)
+
+    async def _get_username(self, github) -> str:
+        """Resolve the GitHub user whose stars are synced."""
+        username = os.getenv("GITHUB_USER")
+        if not username:
+            user = await github.get_authenticated_user()
+            username = user.get("login")
+            if not username:
+                raise ValueError("Could not get authenticated user. Please set GITHUB_USER environment variable.")
+        return username
+
+    def _index_repos(
+        self,
+        github_repos: list[GitHubRepository]
+    ) -> tuple[dict[str, GitHubRepository], str | None]:
+        """Key repos by name_with_owner and find the newest starred_at in one pass.
+
+        Returns:
+            Tuple of (name -> repo map, newest starred_at as ISO string or None)
+        """
+        github_repo_map = {}
+        latest = None
+        for repo in github_repos:
+            github_repo_map[repo.name_with_owner] = repo
+            if repo.starred_at and (latest is None or repo.starred_at > latest):
+                latest = repo.starred_at
+        return github_repo_map, latest.isoformat() if latest else None
+
+    async def _get_last_starred_at(self) -> datetime | None:
+        """Read the starred_at cursor of the last successful sync."""
+        rows = await self.db.execute_query("""
+            SELECT last_starred_at FROM sync_history
+            WHERE last_starred_at IS NOT NULL
+              AND completed_at IS NOT NULL
+              AND error_message IS NULL
+            ORDER BY started_at DESC
+            LIMIT 1
+        """)
+        if not rows:
+            return None
+
+        since = datetime.fromisoformat(rows[0]["last_starred_at"])
+        # GitHub timestamps are UTC; compare aware datetimes
+        return since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+
     def _init_stats(self, sync_type: str) -> dict[str, Any]:
         """Initialize statistics dictionary for sync operation."""
         return {
@@ -108,6 +243,19 @@ class SyncService:
             "errors": [],
         }
 
+    def _record_failure(self, stats: dict, name: str, error: Exception) -> None:
+        """Count a per-repo failure; details are logged once by _log_failure_summary."""
+        stats["failed"] += 1
+        stats["errors"].append(f"{name}: {str(error)}")
+
+    def _log_failure_summary(self, stats: dict) -> None:
+        """Log the collected sync errors as a single message."""
+        errors = stats["errors"]
+        if errors:
+            shown = "; ".join(errors[:ERROR_SUMMARY_LIMIT])
+            more = f" (+{len(errors) - ERROR_SUMMARY_LIMIT} more)" if len(errors) > ERROR_SUMMARY_LIMIT else ""
+            log_error(f"{len(errors)} sync errors: {shown}{more}")
+
     async def _handle_sync_error(self, stats: dict, error: Exception, sync_name: str) -> dict:
         """Handle sync error and record failed history."""
         stats["completed_at"] = datetime.now().isoformat()
@@ -123,17 +271,34 @@ class SyncService:
         stats: dict,
         skip_llm: bool
     ) -> None:
-        """Process and add new repositories."""
+        """Process and add new repositories in a single batch insert."""
+        rows = []
         for name in new_names:
             try:
-                github_repo = github_repo_map[name]
-                await self._add_repository(github_repo, skip_llm)
-                stats["added"] += 1
-                log_debug(f"Added new repo: {name}")
+                rows.append(self._build_repo_data(github_repo_map[name], synced_at=stats.get("started_at")))
+            except Exception as e:
+                self._record_failure(stats, name, e)
+
+        if not rows:
+            return
+
+        added_names = set(await self.db.add_repositories_bulk(rows, return_names=True))
+        added = len(added_names)
+        stats["added"] += added
+        log_debug(f"Added {added} new repos")
+
+        if added < len(rows):
+            stats["failed"] += len(rows) - added
+            stats["errors"].append(f"Failed to add {len(rows) - added} of {len(rows)} new repos")
+            log_error(f"Failed to add {len(rows) - added} of {len(rows)} new repos")
+            # Only index the repos that actually reached the database
+            rows = [row for row in rows if row["name_with_owner"] in added_names]
+
+        if self.semantic_search and rows:
+            try:
+                await self.semantic_search.add_repositories(rows)
             except Exception as e:
-                stats["failed"] += 1
-                stats["errors"].append(f"{name}: {str(e)}")
-                log_error(f"Failed to add {name}: {e}")
+                log_error(f"Failed to add {len(rows)} new repos to vector index: {e}")
 
     async def _process_updates(
         self,
@@ -144,49 +309,90 @@ class SyncService:
         skip_llm: bool,
         force_update: bool = False
     ) -> None:
-        """Process and update existing repositories."""
-        for name in common_names:
-            if await self._should_update_repo(name, github_repo_map, local_repo_map, stats, skip_llm, force_update):
-                stats["updated"] += 1
-                log_debug(f"Updated repo: {name}")
+        """Process and update existing repositories.
+
+        Changes are detected in one synchronous pass, written with a single
+        bulk UPDATE, and the vector index is then refreshed concurrently
+        (bounded by UPDATE_CONCURRENCY) for the repos that need it. The rows
+        in local_repo_map are reused as-is; no repository is read back.
+        """
+        changes = self._diff_batch(
+            common_names, github_repo_map, local_repo_map, stats, skip_llm, force_update
+        )
+        if not changes:
+            return
+
+        rows = []
+        refresh_names = []
+        for name, change_type, changed_fields, needs_llm in changes:
+            try:
+                rows.append((name, self._build_update_data(
+                    github_repo_map[name], change_type, changed_fields, needs_llm, skip_llm,
+                    synced_at=stats.get("started_at")
+                )))
+            except Exception as e:
+                self._record_failure(stats, name, e)
+                continue
+
+            if self._needs_index_refresh(change_type, changed_fields):
+                refresh_names.append(name)
+
+        updated = await self.db.update_repositories_bulk(rows)
+        stats["updated"] += updated
+        log_debug(f"Updated {updated} repos")
+
+        if updated < len(rows):
+            stats["failed"] += len(rows) - updated
+            stats["errors"].append(f"Failed to update {len(rows) - updated} of {len(rows)} repos")
+            log_error(f"Failed to update {len(rows) - updated} of {len(rows)} repos")
+
+        if self.semantic_search and refresh_names:
+            semaphore = asyncio.Semaphore(UPDATE_CONCURRENCY)
+
+            async def refresh_one(name: str) -> None:
+                async with semaphore:
+                    await self._update_vector_index(
+                        name, repo=self._build_vector_doc(github_repo_map[name])
+                    )
+
+            await asyncio.gather(*(refresh_one(name) for name in refresh_names))
+
+            # A forced sync rebuilds all semantic edges afterwards
+            if not force_update:
+                await self._trigger_semantic_edge_updates(refresh_names)
 
-    async def _should_update_repo(
+    def _diff_batch(
         self,
-        name: str,
+        common_names: set[str],
         github_repo_map: dict[str, GitHubRepository],
         local_repo_map: dict[str, dict],
         stats: dict,
         skip_llm: bool,
         force_update: bool = False
-    ) -> bool:
-        """Check if a repository should be updated and perform the update."""
-        try:
-            github_repo = github_repo_map[name]
-            local_repo = local_repo_map[name]
+    ) -> list[tuple[str, str, dict[str, Any], bool]]:
+        """Detect changes for all common repos without touching the database.
 
-            if force_update:
-                change_type = "heavy"
-                changed_fields = {}
-                needs_llm = not skip_llm
-            else:
-                change_type, changed_fields, needs_llm = self._detect_changes(local_repo, github_repo)
-                if change_type == "none":
-                    return False
-
-            await self._update_repository(
-                name_with_owner=github_repo.name_with_owner,
-                github_repo=github_repo,
-                change_type=change_type,
-                changed_fields=changed_fields,
-                needs_llm=needs_llm or not skip_llm,
-                skip_llm=skip_llm
-            )
-            return True
-        except Exception as e:
-            stats["failed"] += 1
-            stats["errors"].append(f"{name}: {str(e)}")
-            log_error(f"Failed to update {name}: {e}")
-            return False
+        Returns:
+            List of (name, change_type, changed_fields, needs_llm) for the
+            repos that need an update
+        """
+        if force_update:
+            return [(name, "heavy", {}, not skip_llm) for name in common_names]
+
+        changes = []
+        for name in common_names:
+            try:
+                change_type, changed_fields, needs_llm = self._detect_changes(
+                    local_repo_map[name], github_repo_map[name]
+                )
+            except Exception as e:
+                self._record_failure(stats, name, e)
+                continue
+
+            if change_type != "none":
+                changes.append((name, change_type, changed_fields, needs_llm or not skip_llm))
+
+        return changes
 
     async def _process_deletions(
         self,
@@ -194,6 +400,30 @@ class SyncService:
         stats: dict
     ) -> None:
         """Process and delete removed repositories."""
+        if not deleted_names:
+            return
+
+        try:
+            stats["deleted"] += await self.db.delete_repositories(list(deleted_names))
+            log_debug(f"Deleted {len(deleted_names)} repos")
+        except Exception as e:
+            log_error(f"Batch delete failed, retrying per repo: {e}")
+            await self._delete_repositories_one_by_one(deleted_names, stats)
+            return
+
+        if self.semantic_search:
+            try:
+                await self.semantic_search.delete_repositories(list(deleted_names))
+                log_debug(f"Deleted {len(deleted_names)} repos from vector index")
+            except Exception as e:
+                log_error(f"Failed to delete repos from vector index: {e}")
+
+    async def _delete_repositories_one_by_one(
+        self,
+        deleted_names: set[str],
+        stats: dict
+    ) -> None:
+        """Delete repositories individually (fallback when the batch fails)."""
         for name in deleted_names:
             try:
                 await self.db.delete_repository(name)
@@ -207,9 +437,7 @@ class SyncService:
                     except Exception as e:
                         log_error(f"Failed to delete {name} from vector index: {e}")
             except Exception as e:
-                stats["failed"] += 1
-                stats["errors"].append(f"{name}: {str(e)}")
-                log_error(f"Failed to delete {name}: {e}")
+                self._record_failure(stats, name, e)
 
     def _detect_changes(
         self,
@@ -224,31 +452,34 @@ class SyncService:
             - changed_fields: Dict of field names to new values
             - needs_llm: Whether LLM re-analysis is needed
         """
-        if local_repo.get("pushed_at") != (github_repo.pushed_at.isoformat() if github_repo.pushed_at else None):
+        if local_repo.get("pushed_at") != github_repo.pushed_at_iso:
             return "heavy", {}, True
 
-        if not local_repo.get("languages"):
+        # Sync index rows carry a has_languages flag; full rows carry the list
+        if not local_repo.get("has_languages", local_repo.get("languages")):
             return "heavy", {}, True
 
-        field_map = {
-            "stargazer_count": github_repo.stargazer_count,
-            "fork_count": github_repo.fork_count,
-            "description": github_repo.description,
-            "primary_language": github_repo.primary_language,
-            "archived": 1 if github_repo.archived else 0,
-            "visibility": github_repo.visibility,
-            "owner_type": github_repo.owner_type,
-        }
+        github_values = (
+            github_repo.stargazer_count,
+            github_repo.fork_count,
+            github_repo.description,
+            github_repo.primary_language,
+            1 if github_repo.archived else 0,
+            github_repo.visibility,
+            github_repo.owner_type,
+        )
+        local_values = tuple(map(local_repo.get, LIGHT_DIFF_FIELDS))
+
+        # Most repos are unchanged: one tuple comparison settles them
+        if local_values == github_values:
+            return "none", {}, False
 
         changed_fields = {
             field: value
-            for field, value in field_map.items()
-            if local_repo.get(field) != value
+            for field, local_value, value in zip(LIGHT_DIFF_FIELDS, local_values, github_values)
+            if local_value != value
         }
 
-        if not changed_fields:
-            return "none", {}, False
-
         needs_llm = any(field in changed_fields for field in ("description", "primary_language"))
 
         return "light", changed_fields, needs_llm
@@ -257,63 +488,93 @@ class SyncService:
         """Check if vector index should be updated based on changed fields."""
         return any(field in changed_fields for field in ("description", "primary_language", "topics"))
 
-    def _build_repo_data(self, github_repo: GitHubRepository, existing: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Build repository data dict from GitHub repo."""
-        base_data = {
+    def _build_repo_data(
+        self,
+        github_repo: GitHubRepository,
+        synced_at: str | None = None
+    ) -> dict[str, Any]:
+        """Build the full row for a new repository from its GitHub data.
+
+        Args:
+            github_repo: Repository from GitHub
+            synced_at: ISO timestamp for last_synced_at (defaults to now);
+                pass the sync start time to avoid formatting it per repo
+        """
+        repo_data = self._build_update_patch(github_repo, synced_at)
+        repo_data.update({
+            "name_with_owner": github_repo.name_with_owner,
+            "name": github_repo.name,
+            "owner": github_repo.owner_login,
+            "summary": github_repo.description or github_repo.name_with_owner,
+            "categories": [],
+            "features": [],
+            "use_cases": []
+        })
+        return repo_data
+
+    def _build_update_patch(
+        self,
+        github_repo: GitHubRepository,
+        synced_at: str | None = None
+    ) -> dict[str, Any]:
+        """Build the GitHub-sourced columns of a repository.
+
+        Analysis columns (summary, categories, features, use_cases) are not
+        included, so updates leave them untouched without reading them first.
+        """
+        return {
             "description": github_repo.description,
             "primary_language": github_repo.primary_language,
-            "languages": [lang.model_dump() for lang in github_repo.languages] if github_repo.languages else [],
+            "languages": github_repo.languages_dump,
             "topics": github_repo.topics or [],
             "stargazer_count": github_repo.stargazer_count,
             "fork_count": github_repo.fork_count,
             "url": github_repo.url,
             "homepage_url": github_repo.homepage_url,
             "readme_content": github_repo.readme_content,
-            "pushed_at": github_repo.pushed_at.isoformat() if github_repo.pushed_at else None,
-            "created_at": github_repo.created_at.isoformat() if github_repo.created_at else None,
+            "pushed_at": github_repo.pushed_at_iso,
+            "created_at": github_repo.created_at_iso,
             "archived": github_repo.archived,
             "visibility": github_repo.visibility,
             "owner_type": github_repo.owner_type,
             "organization": github_repo.organization,
-            "last_synced_at": datetime.now().isoformat(),
-            "starred_at": github_repo.starred_at.isoformat() if github_repo.starred_at else None,
+            "last_synced_at": synced_at or datetime.now().isoformat(),
+            "starred_at": github_repo.starred_at_iso,
         }
 
-        if existing:
-            base_data.update({
-                "summary": existing.get("summary"),
-                "categories": existing.get("categories", []),
-                "features": existing.get("features", []),
-                "use_cases": existing.get("use_cases", [])
-            })
-        else:
-            base_data.update({
-                "name_with_owner": github_repo.name_with_owner,
-                "name": github_repo.name,
-                "owner": github_repo.owner_login,
-                "starred_at": github_repo.starred_at.isoformat() if github_repo.starred_at else None,
-                "summary": github_repo.description or github_repo.name_with_owner,
-                "categories": [],
-                "features": [],
-                "use_cases": []
-            })
-
-        return base_data
-
-    async def _trigger_semantic_edge_update(self, name_with_owner: str) -> None:
-        """Trigger semantic edge update asynchronously."""
-        if self.semantic_edge_discovery:
+    async def _trigger_semantic_edge_updates(self, names: list[str]) -> None:
+        """Trigger one asynchronous semantic edge update for a batch of repos."""
+        if self.semantic_edge_discovery and names:
             asyncio.create_task(
-                self.semantic_edge_discovery.update_edges_for_repo(name_with_owner)
+                self.semantic_edge_discovery.update_edges_for_repos(names)
             )
 
-    async def _update_vector_index(self, name_with_owner: str) -> bool:
-        """Update vector index for a repository."""
+    def _build_vector_doc(self, github_repo: GitHubRepository) -> dict[str, Any]:
+        """Build the fields the vector index embeds and stores for a repository."""
+        return {
+            "name_with_owner": github_repo.name_with_owner,
+            "name": github_repo.name,
+            "description": github_repo.description,
+            "primary_language": github_repo.primary_language,
+            "url": github_repo.url,
+            "topics": github_repo.topics or [],
+        }
+
+    async def _update_vector_index(
+        self,
+        name_with_owner: str,
+        repo: dict[str, Any] | None = None
+    ) -> bool:
+        """Update vector index for a repository.
+
+        Pass ``repo`` when the indexed fields are already in memory (see
+        _build_vector_doc); otherwise the row is read back from the database.
+        """
         if not self.semantic_search:
             return False
 
         try:
-            updated_repo = await self.db.get_repository(name_with_owner)
+            updated_repo = repo if repo is not None else await self.db.get_repository(name_with_owner)
             if updated_repo:
                 await self.semantic_search.update_repository(updated_repo)
                 log_debug(f"Updated vector index: {name_with_owner}")
@@ -323,63 +584,29 @@ class SyncService:
 
         return False
 
-    async def _add_repository(
+    def _build_update_data(
         self,
         github_repo: GitHubRepository,
-        skip_llm: bool = True
-    ) -> None:
-        """Add a new repository to the database."""
-        repo_data = self._build_repo_data(github_repo)
-        await self.db.add_repository(repo_data)
-
-        if self.semantic_search:
-            try:
-                await self.semantic_search.add_repositories([repo_data])
-            except Exception as e:
-                log_error(f"Failed to add {github_repo.name_with_owner} to vector index: {e}")
-
-    async def _update_repository(
-        self,
-        name_with_owner: str,
-        github_repo: GitHubRepository,
         change_type: str,
         changed_fields: dict[str, Any],
         needs_llm: bool,
-        skip_llm: bool = True
-    ) -> None:
-        """Update an existing repository in the database."""
-        existing = await self.db.get_repository(name_with_owner)
-        if not existing:
-            await self._add_repository(github_repo, skip_llm)
-            return
+        skip_llm: bool = True,
+        synced_at: str | None = None
+    ) -> dict[str, Any]:
+        """Build the column updates for a changed repository.
 
-        if change_type == "light":
-            if needs_llm and not skip_llm:
-                update_data = self._build_repo_data(github_repo, existing)
-                await self.db.update_repository(name_with_owner, update_data)
-                log_debug(f"Light update with LLM: {name_with_owner} (fields: {list(changed_fields.keys())})")
-            else:
-                update_data = changed_fields.copy()
-                update_data.update({
-                    "summary": existing.get("summary"),
-                    "categories": existing.get("categories", []),
-                    "features": existing.get("features", []),
-                    "use_cases": existing.get("use_cases", [])
-                })
-                await self.db.update_repository(name_with_owner, update_data)
-                log_debug(f"Light update without LLM: {name_with_owner} (fields: {list(changed_fields.keys())})")
-
-            if self.semantic_search and self._needs_vector_update(changed_fields):
-                await self._update_vector_index(name_with_owner)
-                await self._trigger_semantic_edge_update(name_with_owner)
-        else:  # heavy
-            update_data = self._build_repo_data(github_repo, existing)
-            await self.db.update_repository(name_with_owner, update_data)
-            log_debug(f"Heavy update: {name_with_owner}")
-
-            if self.semantic_search:
-                await self._update_vector_index(name_with_owner)
-                await self._trigger_semantic_edge_update(name_with_owner)
+        Heavy changes (and light changes that need LLM re-analysis) rewrite
+        the GitHub metadata; other light changes only write the changed
+        fields. Analysis columns are never written, so they are preserved.
+        """
+        if change_type != "light" or (needs_llm and not skip_llm):
+            return self._build_update_patch(github_repo, synced_at)
+
+        return changed_fields.copy()
+
+    def _needs_index_refresh(self, change_type: str, changed_fields: dict[str, Any]) -> bool:
+        """Check if an update should refresh the vector index and semantic edges."""
+        return change_type != "light" or self._needs_vector_update(changed_fields)
 
     async def _record_sync_history(self, stats: dict[str, Any]) -> None:
         """Record sync operation to history table."""
@@ -388,8 +615,8 @@ class SyncService:
                 INSERT INTO sync_history (
                     sync_type, started_at, completed_at,
                     stats_added, stats_updated, stats_deleted, stats_failed,
-                    error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    error_message, last_starred_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 stats["sync_type"],
                 stats["started_at"],
@@ -398,7 +625,8 @@ class SyncService:
                 stats["updated"],
                 stats["deleted"],
                 stats["failed"],
-                "; ".join(stats["errors"])[:1000] if stats["errors"] else None
+                "; ".join(stats["errors"])[:1000] if stats["errors"] else None,
+                stats.get("last_starred_at")
             ))
         except Exception as e:
             log_error(f"Failed to record sync history: {e}")
@@ -1,23 +1,83 @@
 """Vectorization service for repository embeddings."""
 
+import asyncio
+import hashlib
 import logging
-import re
+from collections import OrderedDict
 from typing import List, Dict, Any
-from src.vector.embeddings import OllamaEmbeddings
+
+import orjson
+from src.vector.embeddings import OllamaEmbeddings, get_embed_executor
 from src.vector.chroma_store import ChromaDBStore
-from src.vector.readme_filter import extract_readme_summary
+from src.vector.readme_filter import BADGE_RE, extract_readme_summary
 
 logger = logging.getLogger(__name__)
 
-# Badge pattern to remove from README (same as in readme_filter.py)
-BADGE_PATTERN = r'\[!\[.*?\]\(.*?\)\]\(.*?\)|\!\[.*?\]\(.*?\)'
-
 # Constants for text processing
 MIN_README_SUMMARY_LENGTH = 300
 MAX_README_CONTENT_LENGTH = 2000
 DESCRIPTION_REPEAT_COUNT = 4
 MIN_TEXT_LENGTH = 10
 
+# README 摘要的进程内缓存条目数
+README_SUMMARY_CACHE_SIZE = 4096
+
+# README 的 sha1 摘要 -> 清理后的 README 摘要（LRU）
+_readme_summary_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+
+def _summarize_readme(readme: str) -> str:
+    """提取用于 embedding 的 README 摘要"""
+    readme_summary = extract_readme_summary(readme, max_length=500)
+
+    # 如果过滤后太短，使用更多原始 README 内容
+    if len(readme_summary) < MIN_README_SUMMARY_LENGTH and len(readme) > 0:
+        readme_cleaned = BADGE_RE.sub('', readme)
+        readme_summary = readme_cleaned[:MAX_README_CONTENT_LENGTH] if len(readme_cleaned) > MAX_README_CONTENT_LENGTH else readme_cleaned
+
+    return readme_summary
+
+
+def _cached_readme_summary(readme: str) -> str:
+    """
+    按 README 内容的 sha1 缓存摘要
+
+    缓存键是 20 字节摘要而不是 README 原文，README 未变化时重复同步
+    可直接复用结果，跳过正则清理和摘要提取。
+    """
+    key = hashlib.sha1(readme.encode("utf-8")).digest()
+    summary = _readme_summary_cache.get(key)
+    if summary is not None:
+        _readme_summary_cache.move_to_end(key)
+        return summary
+
+    summary = _summarize_readme(readme)
+    _readme_summary_cache[key] = summary
+    if len(_readme_summary_cache) > README_SUMMARY_CACHE_SIZE:
+        _readme_summary_cache.popitem(last=False)
+    return summary
+
+
+def _build_embedding_text(name: str, description: str, language: str, readme: str) -> str:
+    """根据仓库字段拼接 embedding 文本"""
+    readme_summary = _cached_readme_summary(readme) if readme else ""
+
+    # 拼接文本：description 重复多次以最大化权重
+    parts = []
+    if name:
+        parts.append(name)
+    if description:
+        # 重复 description 以增加其在 embedding 中的权重
+        for _ in range(DESCRIPTION_REPEAT_COUNT):
+            parts.append(f"- {description}")
+    # 添加语言标签作为区分特征
+    if language:
+        parts.append(f"\n编程语言: {language}")
+    if readme_summary:
+        parts.append(f"\n\n{readme_summary}")
+
+    return " ".join(parts)
+
 
 class VectorizationService:
     """仓库向量化服务"""
@@ -52,34 +112,12 @@ class VectorizationService:
         Returns:
             拼接后的文本
         """
-        name = repo.get("name", "")
-        description = repo.get("description", "")
-        readme = repo.get("readme_content", "")
-
-        # 提取 README 摘要
-        readme_summary = extract_readme_summary(readme, max_length=500)
-
-        # 如果过滤后太短，使用更多原始 README 内容
-        if len(readme_summary) < MIN_README_SUMMARY_LENGTH and len(readme) > 0:
-            readme_cleaned = re.sub(BADGE_PATTERN, '', readme)
-            readme_summary = readme_cleaned[:MAX_README_CONTENT_LENGTH] if len(readme_cleaned) > MAX_README_CONTENT_LENGTH else readme_cleaned
-
-        # 拼接文本：description 重复多次以最大化权重
-        parts = []
-        if name:
-            parts.append(name)
-        if description:
-            # 重复 description 以增加其在 embedding 中的权重
-            for _ in range(DESCRIPTION_REPEAT_COUNT):
-                parts.append(f"- {description}")
-        # 添加语言标签作为区分特征
-        language = repo.get("primary_language", "")
-        if language:
-            parts.append(f"\n编程语言: {language}")
-        if readme_summary:
-            parts.append(f"\n\n{readme_summary}")
-
-        return " ".join(parts)
+        return _build_embedding_text(
+            repo.get("name", ""),
+            repo.get("description", ""),
+            repo.get("primary_language", ""),
+            repo.get("readme_content", "")
+        )
 
     def _prepare_metadata(self, repo: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -96,9 +134,28 @@ class VectorizationService:
             "owner": repo.get("owner", ""),
             "primary_language": repo.get("primary_language", ""),
             "stargazer_count": repo.get("stargazer_count", 0),
-            "topics": str(repo.get("topics", []))
+            # Chroma 元数据只支持标量，topics 以 JSON 字符串存储（可 orjson.loads 还原）
+            "topics": orjson.dumps(repo.get("topics") or []).decode(),
+            # 记录生成向量的模型，换模型后旧向量不再复用
+            "embedding_model": self.embeddings.model
         }
 
+    def _is_reusable(self, stored: tuple, text: str) -> bool:
+        """
+        判断已存储的 embedding 是否可以直接复用
+
+        文本和生成向量的模型都必须与当前一致。
+
+        Args:
+            stored: get_embeddings 返回的 (document, embedding, metadata)
+            text: 当前准备的文本
+
+        Returns:
+            是否可复用
+        """
+        document, _, metadata = stored
+        return document == text and metadata.get("embedding_model") == self.embeddings.model
+
     async def index_repository(self, repo: Dict[str, Any]) -> bool:
         """
         为单个仓库生成并存储 embedding
@@ -120,7 +177,7 @@ class VectorizationService:
             logger.warning(f"Insufficient text for {repo_id}")
             return False
 
-        # 生成 embedding
+        # 生成 embedding（已存储向量的复用只在 index_batch 中批量查询）
         embedding = self.embeddings.embed_text(text)
         if not embedding:
             logger.error(f"Failed to generate embedding for {repo_id}")
@@ -147,34 +204,49 @@ class VectorizationService:
         if not repos:
             return 0
 
-        repo_ids = []
-        texts = []
-        embeddings = []
-        metadata_list = []
-
+        # 先准备所有文本，过滤掉无效仓库
+        candidates = []
         for repo in repos:
             repo_id = repo.get("name_with_owner")
             if not repo_id:
                 continue
 
-            # 准备文本
             text = self._prepare_text(repo)
             if not text or len(text.strip()) < MIN_TEXT_LENGTH:
                 continue
 
-            # 生成 embedding
-            embedding = self.embeddings.embed_text(text)
+            candidates.append((repo_id, text, repo))
+
+        # 文本和模型都未变化的仓库直接复用已存储的 embedding
+        stored = self.store.get_embeddings([repo_id for repo_id, _, _ in candidates])
+
+        # 其余的并发生成 embedding（embed_text 是同步 HTTP 调用，在共享的
+        # embedding 线程池中执行，并发数由线程池上限 EMBED_CONCURRENCY 控制）
+        loop = asyncio.get_running_loop()
+        executor = get_embed_executor()
+
+        async def embed(repo_id: str, text: str) -> List[float]:
+            cached = stored.get(repo_id)
+            if cached and self._is_reusable(cached, text):
+                return cached[1]
+            return await loop.run_in_executor(executor, self.embeddings.embed_text, text)
+
+        results = await asyncio.gather(*(embed(repo_id, text) for repo_id, text, _ in candidates))
+
+        repo_ids = []
+        texts = []
+        embeddings = []
+        metadata_list = []
+
+        for (repo_id, text, repo), embedding in zip(candidates, results):
             if not embedding:
                 logger.warning(f"Skipping {repo_id}: no embedding generated")
                 continue
 
-            # 准备元数据
-            metadata = self._prepare_metadata(repo)
-
             repo_ids.append(repo_id)
             texts.append(text)
             embeddings.append(embedding)
-            metadata_list.append(metadata)
+            metadata_list.append(self._prepare_metadata(repo))
 
         # 批量添加到存储
         if repo_ids:
@@ -1,4 +1,8 @@
 """Utilities package."""
 from .logging import log_info, log_error, log_debug, log_warning
+from .cache import AsyncTTLCache, db_cache_key, db_version, stats_cache, similar_cache
 
-__all__ = ["log_info", "log_error", "log_debug", "log_warning"]
+__all__ = [
+    "log_info", "log_error", "log_debug", "log_warning",
+    "AsyncTTLCache", "db_cache_key", "db_version", "stats_cache", "similar_cache",
+]
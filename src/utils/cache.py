@@ -0,0 +1,126 @@
+"""
+Small async caching utilities.
+
+Used to memoize slow-changing aggregates (statistics, category counts).
+"""
+import asyncio
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """
+    Async TTL cache for expensive coroutine results.
+
+    Entries expire after ``ttl`` seconds or when the ``version`` passed to
+    ``get_or_set`` changes. A lock per key ensures only one caller recomputes
+    an expired entry while the others wait for its result. With ``maxsize``
+    set, the least recently used entry is evicted once the cache is full.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: Optional[int] = None):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Time to live for entries in seconds
+            maxsize: Maximum number of entries (None for unbounded)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    def _lookup(self, key: Hashable, version: Any) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, entry_version, value = entry
+        if expires_at <= time.monotonic() or entry_version != version:
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        version: Any = None
+    ) -> Any:
+        """
+        Return the cached value for key, computing it with factory if needed.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value
+            version: Optional data version; a different version is a miss
+
+        Returns:
+            Cached or freshly computed value
+        """
+        hit, value = self._lookup(key, version)
+        if hit:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the entry while we waited
+            hit, value = self._lookup(key, version)
+            if hit:
+                return value
+
+            value = await factory()
+            self._entries[key] = (time.monotonic() + self.ttl, version, value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._locks.pop(evicted, None)
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop a cached entry, or all entries if key is None.
+
+        Args:
+            key: Cache key to drop
+        """
+        if key is None:
+            self._entries.clear()
+            self._locks.clear()
+        else:
+            self._entries.pop(key, None)
+            self._locks.pop(key, None)
+
+
+def db_cache_key(db: Any) -> Hashable:
+    """
+    Stable cache key for a database.
+
+    Uses the database's ``cache_key`` (its path) rather than the object
+    itself, so cache entries don't keep database instances alive.
+    """
+    return getattr(db, "cache_key", id(db))
+
+
+async def db_version(db: Any) -> Any:
+    """
+    Current data version of a database, for ``get_or_set(version=...)``.
+
+    Prefers ``data_version()``, which also sees commits from other
+    connections, and falls back to the per-connection ``total_changes``.
+    """
+    data_version = getattr(db, "data_version", None)
+    if inspect.iscoroutinefunction(data_version):
+        return await data_version()
+    return getattr(db, "total_changes", None)
+
+
+# Shared cache for database statistics (language/category counts, totals)
+stats_cache = AsyncTTLCache(ttl=60.0, maxsize=64)
+
+# Shared cache for "similar repositories" lookups, keyed by repo and limit
+similar_cache = AsyncTTLCache(ttl=300.0, maxsize=1024)
@@ -51,7 +51,7 @@ class ChromaDBStore:
         metadata: Dict[str, Any]
     ) -> None:
         """
-        Add repository vector.
+        Add or replace repository vector.
 
         Args:
             repo_id: Repository unique identifier (name_with_owner)
@@ -60,7 +60,7 @@ class ChromaDBStore:
             metadata: Metadata dictionary
         """
         try:
-            self.collection.add(
+            self.collection.upsert(
                 ids=[repo_id],
                 embeddings=[embedding],
                 documents=[text],
@@ -78,7 +78,7 @@ class ChromaDBStore:
         metadata_list: List[Dict[str, Any]]
     ) -> int:
         """
-        Batch add repository vectors.
+        Batch add or replace repository vectors.
 
         Args:
             repo_ids: Repository ID list
@@ -93,7 +93,7 @@ class ChromaDBStore:
             return 0
 
         try:
-            self.collection.add(
+            self.collection.upsert(
                 ids=repo_ids,
                 embeddings=embeddings,
                 documents=texts,
@@ -105,6 +105,35 @@ class ChromaDBStore:
             logger.error(f"Batch add failed: {e}")
             return 0
 
+    def get_embeddings(self, repo_ids: List[str]) -> Dict[str, tuple]:
+        """
+        Get stored documents and embeddings.
+
+        Args:
+            repo_ids: Repository ID list
+
+        Returns:
+            Mapping of repo_id to (document, embedding, metadata) for the
+            stored IDs
+        """
+        if not repo_ids:
+            return {}
+
+        try:
+            results = self.collection.get(
+                ids=repo_ids, include=["documents", "embeddings", "metadatas"]
+            )
+        except Exception as e:
+            logger.error(f"Failed to get embeddings: {e}")
+            return {}
+
+        return {
+            repo_id: (document, list(embedding), metadata or {})
+            for repo_id, document, embedding, metadata in zip(
+                results["ids"], results["documents"], results["embeddings"], results["metadatas"]
+            )
+        }
+
     def search(
         self,
         query_embedding: List[float],
@@ -1,12 +1,39 @@
 """Ollama embedding service."""
+import asyncio
 import httpx
 import logging
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 import requests
 from requests.exceptions import Timeout, RequestException
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent embedding requests sent to Ollama (OllamaEmbedder.embed_batch
+# and the shared thread pool used by the synchronous OllamaEmbeddings client)
+EMBED_CONCURRENCY = 8
+
+_embed_executor: Optional[ThreadPoolExecutor] = None
+_embed_executor_lock = threading.Lock()
+
+
+def get_embed_executor() -> ThreadPoolExecutor:
+    """
+    Shared thread pool for synchronous embedding requests.
+
+    Created on first use and bounded by EMBED_CONCURRENCY, so every caller
+    of the blocking client (OllamaEmbeddings.embed_batch, index_batch)
+    shares one concurrency limit instead of stacking pools and semaphores.
+    """
+    global _embed_executor
+    with _embed_executor_lock:
+        if _embed_executor is None:
+            _embed_executor = ThreadPoolExecutor(
+                max_workers=EMBED_CONCURRENCY, thread_name_prefix="ollama-embed"
+            )
+        return _embed_executor
+
 
 class OllamaEmbedder:
     """Generate embeddings using Ollama API."""
@@ -25,6 +52,29 @@ class OllamaEmbedder:
         """
         self.base_url = base_url
         self.model = model
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared keep-alive client, creating it for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(
+                    max_connections=EMBED_CONCURRENCY * 2,
+                    max_keepalive_connections=EMBED_CONCURRENCY
+                )
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     async def embed(self, text: str) -> list[float]:
         """
@@ -36,30 +86,34 @@ class OllamaEmbedder:
         Returns:
             Vector embedding as list of floats
         """
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/api/embeddings",
-                json={"model": self.model, "prompt": text}
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["embedding"]
+        response = await self._get_client().post(
+            f"{self.base_url}/api/embeddings",
+            json={"model": self.model, "prompt": text}
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["embedding"]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """
         Generate embeddings for multiple texts.
 
+        Requests run concurrently (up to EMBED_CONCURRENCY at a time);
+        results keep the order of texts.
+
         Args:
             texts: List of input texts
 
         Returns:
             List of vector embeddings
         """
-        embeddings = []
-        for text in texts:
-            embedding = await self.embed(text)
-            embeddings.append(embedding)
-        return embeddings
+        semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+
+        async def embed_one(text: str) -> list[float]:
+            async with semaphore:
+                return await self.embed(text)
+
+        return list(await asyncio.gather(*(embed_one(text) for text in texts)))
 
 
 class OllamaEmbeddings:
@@ -84,6 +138,37 @@ class OllamaEmbeddings:
         self.timeout = timeout
         self._batch_size = 10  # 每批最多处理 10 个文本
 
+        # requests.Session 不保证线程安全：每个线程使用自己的 Session
+        # （仍复用 keep-alive 连接），close() 时统一关闭
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def __enter__(self) -> "OllamaEmbeddings":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def _session(self) -> requests.Session:
+        """当前线程的 HTTP Session（首次使用时创建）"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """关闭所有线程创建的 HTTP Session"""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
     def embed_text(self, text: str) -> List[float]:
         """
         生成单段文本的 embedding
@@ -98,7 +183,7 @@ class OllamaEmbeddings:
             return []
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/embeddings",
                 json={
                     "model": self.model,
@@ -138,11 +223,11 @@ class OllamaEmbeddings:
         """
         results = []
 
-        # 分批处理，避免过载
+        # 分批处理，避免过载；批内在共享线程池中并发请求（等待网络时会释放 GIL）
+        executor = get_embed_executor()
         for i in range(0, len(texts), self._batch_size):
             batch = texts[i:i + self._batch_size]
-            batch_results = [self.embed_text(text) for text in batch]
-            results.extend(batch_results)
+            results.extend(executor.map(self.embed_text, batch))
 
         return results
 
@@ -154,7 +239,7 @@ class OllamaEmbeddings:
             True 如果服务正常，否则 False
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/tags",
                 timeout=5
             )
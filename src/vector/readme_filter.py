@@ -16,8 +16,12 @@ SKIP_SECTIONS = {
     "acknowledgements", "acknowledgments", "致谢"
 }
 
-# 移除 Badge 徽章
-BADGE_PATTERN = r'\[!\[.*?\]\(.*?\)\]\(.*?\)|\!\[.*?\]\(.*?\)'
+# 移除 Badge 徽章（使用有界字符类，避免长 README 上的回溯）
+BADGE_PATTERN = r'\[!\[[^\]\n]*\]\([^)\n]*\)\]\([^)\n]*\)|!\[[^\]\n]*\]\([^)\n]*\)'
+BADGE_RE = re.compile(BADGE_PATTERN)
+
+# Markdown 章节标题
+SECTION_RE = re.compile(r'^#{1,6}\s+(.+)$')
 
 def extract_readme_summary(readme_content: str, max_length: int = 500) -> str:
     """
@@ -34,7 +38,7 @@ def extract_readme_summary(readme_content: str, max_length: int = 500) -> str:
         return ""
 
     # 移除 Badge 徽章
-    cleaned = re.sub(BADGE_PATTERN, '', readme_content)
+    cleaned = BADGE_RE.sub('', readme_content)
 
     lines = cleaned.split('\n')
     summary_lines = []
@@ -42,8 +46,8 @@ def extract_readme_summary(readme_content: str, max_length: int = 500) -> str:
     current_length = 0
 
     for line in lines:
-        # 检测章节标题
-        section_match = re.match(r'^#{1,6}\s+(.+)$', line)
+        # 检测章节标题（只有以 # 开头的行才需要跑正则）
+        section_match = SECTION_RE.match(line) if line.startswith('#') else None
         if section_match:
             section_title = section_match.group(1).strip().lower()
 
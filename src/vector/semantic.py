@@ -63,15 +63,29 @@ class SemanticSearch:
             for repo in repos
         ]
 
-        self.collection.add(embeddings=embeddings, ids=ids, metadatas=metadatas)
+        # upsert so re-added repositories replace their stale vectors
+        self.collection.upsert(embeddings=embeddings, ids=ids, metadatas=metadatas)
 
-    async def search(self, query: str, top_k: int = 10) -> list[dict]:
-        """Search for similar repositories."""
+    async def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        where: dict | None = None
+    ) -> list[dict]:
+        """Search for similar repositories.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            where: Optional ChromaDB metadata filter, evaluated during the
+                vector search (e.g. {"primary_language": {"$in": [...]}})
+        """
         query_embedding = await self.embedder.embed(query)
 
         results = self.collection.query(
             query_embeddings=[query_embedding],
-            n_results=top_k
+            n_results=top_k,
+            where=where
         )
 
         repos = []
@@ -138,6 +152,21 @@ class SemanticSearch:
         except Exception:
             pass
 
+    async def delete_repositories(self, names: list[str]) -> None:
+        """Delete several repositories from vector store in one call."""
+        ids = [name for name in names if name]
+        if not ids:
+            return
+
+        try:
+            self.collection.delete(ids=ids)
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        """Release the embedder's HTTP connections."""
+        await self.embedder.aclose()
+
     def _repo_to_text(self, repo: dict) -> str:
         """Convert repository dict to text for embedding."""
         parts = [
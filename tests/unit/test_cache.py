@@ -0,0 +1,121 @@
+"""Tests for async TTL cache."""
+import asyncio
+import sqlite3
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.stats import StatsService
+from src.utils.cache import AsyncTTLCache, stats_cache
+
+
+@pytest.mark.asyncio
+async def test_cache_returns_cached_value_within_ttl():
+    cache = AsyncTTLCache(ttl=60)
+    factory = AsyncMock(return_value={"total": 1})
+
+    first = await cache.get_or_set("stats", factory)
+    second = await cache.get_or_set("stats", factory)
+
+    assert first == second == {"total": 1}
+    factory.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_version_change():
+    cache = AsyncTTLCache(ttl=0)
+    factory = AsyncMock(side_effect=[1, 2, 3])
+
+    assert await cache.get_or_set("key", factory) == 1
+    # ttl=0 expires immediately
+    assert await cache.get_or_set("key", factory) == 2
+
+    cache.ttl = 60
+    assert await cache.get_or_set("key", factory, version=1) == 3
+    assert await cache.get_or_set("key", factory, version=1) == 3
+    assert factory.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidate():
+    cache = AsyncTTLCache(ttl=60)
+    factory = AsyncMock(side_effect=[1, 2])
+
+    await cache.get_or_set("key", factory)
+    cache.invalidate("key")
+
+    assert await cache.get_or_set("key", factory) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    cache = AsyncTTLCache(ttl=60, maxsize=2)
+    factory = AsyncMock(side_effect=["a", "b", "c", "a2"])
+
+    await cache.get_or_set("a", factory)
+    await cache.get_or_set("b", factory)
+    # Touch "a" so "b" becomes the eviction candidate
+    await cache.get_or_set("a", factory)
+    await cache.get_or_set("c", factory)
+
+    assert await cache.get_or_set("a", factory) == "a"
+    assert await cache.get_or_set("c", factory) == "c"
+    assert factory.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compute_once():
+    cache = AsyncTTLCache(ttl=60)
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(cache.get_or_set("key", factory) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stats_service_uses_cache():
+    stats_cache.invalidate()
+    db = MagicMock()
+    db.get_statistics = AsyncMock(return_value={"total_repositories": 30})
+
+    service = StatsService()
+    await service.get_stats("有多少项目", db)
+    await StatsService().get_stats("有多少项目", db)
+
+    db.get_statistics.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stats_cache_sees_writes_from_other_connections(db):
+    stats_cache.invalidate()
+    await db.add_repository({
+        "name_with_owner": "owner/repo1",
+        "name": "repo1",
+        "owner": "owner",
+        "stargazer_count": 1,
+    })
+    service = StatsService()
+    assert "总共收藏了 1 个项目" in await service.get_stats("有多少项目", db)
+
+    # Write through a separate connection; total_changes on db doesn't move
+    changes = db.total_changes
+    other = sqlite3.connect(db.db_path)
+    other.execute(
+        "INSERT INTO repositories (name_with_owner, name, owner) "
+        "VALUES ('owner/repo2', 'repo2', 'owner')"
+    )
+    other.commit()
+    other.close()
+    assert db.total_changes == changes
+
+    assert "总共收藏了 2 个项目" in await service.get_stats("有多少项目", db)
+    # Keyed by path, so the cache doesn't hold the database object
+    assert ("statistics", db.db_path) in stats_cache._entries
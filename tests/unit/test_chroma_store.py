@@ -103,3 +103,18 @@ def test_search_returns_metadata(temp_store):
 
     assert len(results) == 1
     assert results[0]["metadata"] == metadata
+
+
+def test_get_embeddings_and_upsert(temp_store):
+    """Test stored embeddings are returned and re-adding replaces them."""
+    temp_store.add("test/repo", "old text", [0.1] * 768, {"language": "Python"})
+    temp_store.add("test/repo", "new text", [0.2] * 768, {"language": "Python"})
+
+    stored = temp_store.get_embeddings(["test/repo", "test/missing"])
+
+    assert list(stored) == ["test/repo"]
+    document, embedding, metadata = stored["test/repo"]
+    assert document == "new text"
+    assert embedding[0] == pytest.approx(0.2)
+    assert metadata == {"language": "Python"}
+    assert temp_store.get_count() == 1
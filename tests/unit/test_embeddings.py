@@ -1,10 +1,14 @@
 """Unit tests for Ollama Embeddings client."""
 
+import asyncio
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 from requests.exceptions import Timeout
 
-from src.vector.embeddings import OllamaEmbeddings
+from src.vector.embeddings import EMBED_CONCURRENCY, OllamaEmbedder, OllamaEmbeddings
 
 
 class TestOllamaEmbeddings:
@@ -28,7 +32,7 @@ class TestOllamaEmbeddings:
             "embedding": [0.1, 0.2, 0.3, 0.4, 0.5]
         }
 
-        with patch("src.vector.embeddings.requests.post", return_value=mock_response):
+        with patch("src.vector.embeddings.requests.Session.post", return_value=mock_response):
             result = client.embed_text("test text")
 
             # Verify embedding is returned
@@ -42,7 +46,7 @@ class TestOllamaEmbeddings:
     def test_embed_text_timeout(self, client):
         """Test text embedding with timeout error."""
         # Mock timeout exception
-        with patch("src.vector.embeddings.requests.post", side_effect=Timeout()):
+        with patch("src.vector.embeddings.requests.Session.post", side_effect=Timeout()):
             result = client.embed_text("test text")
 
             # Verify empty list is returned on timeout
@@ -59,7 +63,7 @@ class TestOllamaEmbeddings:
 
         texts = ["text1", "text2", "text3"]
 
-        with patch("src.vector.embeddings.requests.post", return_value=mock_response):
+        with patch("src.vector.embeddings.requests.Session.post", return_value=mock_response):
             results = client.embed_batch(texts)
 
             # Verify all embeddings are returned
@@ -72,13 +76,59 @@ class TestOllamaEmbeddings:
             # Verify API was called 3 times
             assert mock_response.json.call_count == 3
 
+    def test_embed_batch_runs_batch_concurrently(self, client):
+        """Test batch texts are embedded in parallel threads, in order."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def slow_embed(text):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return [float(text)]
+
+        texts = [str(i) for i in range(25)]
+        with patch.object(client, "embed_text", side_effect=slow_embed):
+            results = client.embed_batch(texts)
+
+        assert results == [[float(t)] for t in texts]
+        assert 1 < peak <= min(client._batch_size, EMBED_CONCURRENCY)
+
+    def test_sessions_are_per_thread_and_closed(self, client):
+        """Test each thread gets its own Session and close() releases them."""
+        main_session = client._session
+        assert client._session is main_session
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(client._session))
+        worker.start()
+        worker.join()
+        assert other[0] is not main_session
+
+        with patch("src.vector.embeddings.requests.Session.close") as close:
+            client.close()
+        assert close.call_count == 2
+        assert client._session is not main_session
+
+    def test_context_manager_closes_sessions(self):
+        """Test the client closes its sessions when used as a context manager."""
+        with patch("src.vector.embeddings.requests.Session.close") as close:
+            with OllamaEmbeddings() as client:
+                client._session
+        close.assert_called_once()
+
     def test_check_health_success(self, client):
         """Test successful health check."""
         # Mock successful health check response
         mock_response = Mock()
         mock_response.status_code = 200
 
-        with patch("src.vector.embeddings.requests.get", return_value=mock_response):
+        with patch("src.vector.embeddings.requests.Session.get", return_value=mock_response):
             result = client.check_health()
 
             # Verify health check returns True
@@ -90,7 +140,7 @@ class TestOllamaEmbeddings:
         mock_response = Mock()
         mock_response.status_code = 503
 
-        with patch("src.vector.embeddings.requests.get", return_value=mock_response):
+        with patch("src.vector.embeddings.requests.Session.get", return_value=mock_response):
             result = client.check_health()
 
             # Verify health check returns False
@@ -99,8 +149,46 @@ class TestOllamaEmbeddings:
     def test_check_health_exception(self, client):
         """Test health check with connection exception."""
         # Mock connection exception
-        with patch("src.vector.embeddings.requests.get", side_effect=Exception("Connection error")):
+        with patch("src.vector.embeddings.requests.Session.get", side_effect=Exception("Connection error")):
             result = client.check_health()
 
             # Verify health check returns False on exception
             assert result is False
+
+
+class TestOllamaEmbedder:
+    """Test suite for the async OllamaEmbedder."""
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_runs_concurrently_in_order(self):
+        """Test batch embeddings run concurrently, bounded, and keep input order."""
+        embedder = OllamaEmbedder()
+        running = 0
+        peak = 0
+
+        async def fake_embed(text):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [float(text)]
+
+        texts = [str(i) for i in range(EMBED_CONCURRENCY * 2)]
+        with patch.object(embedder, "embed", side_effect=fake_embed):
+            results = await embedder.embed_batch(texts)
+
+        assert results == [[float(t)] for t in texts]
+        assert peak == EMBED_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_embed_reuses_client(self):
+        """Test embeddings share one keep-alive client until closed."""
+        embedder = OllamaEmbedder()
+        client = embedder._get_client()
+        assert embedder._get_client() is client
+
+        await embedder.aclose()
+        assert client.is_closed
+        assert embedder._get_client() is not client
+        await embedder.aclose()
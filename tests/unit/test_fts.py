@@ -35,3 +35,99 @@ async def test_fts_search_no_results(db):
     """Test FTS5 with query that has no matches"""
     results = await db.search_repositories_fulltext("nonexistentqueryterm123")
     assert results == []
+
+
+@pytest.mark.asyncio
+async def test_fts_search_with_filters(db):
+    """Test FTS5 search combined with repository filters"""
+    for name, language, stars in [("test/py-tool", "Python", 300), ("test/go-tool", "Go", 50)]:
+        await db.add_repository({
+            "name_with_owner": name,
+            "name": name.split("/")[1],
+            "owner": "test",
+            "description": "A handy command line tool",
+            "primary_language": language,
+            "stargazer_count": stars,
+        })
+
+    results = await db.search_repositories_fulltext("tool", languages=["Python"])
+    assert [r["name_with_owner"] for r in results] == ["test/py-tool"]
+
+    result = await db.search_repositories_fulltext("tool", min_stars=100, return_count=True)
+    assert result["total"] == 1
+    assert result["results"][0]["name_with_owner"] == "test/py-tool"
+
+
+@pytest.mark.asyncio
+async def test_fts_search_filters_rows_ranked_past_the_page(db):
+    """Test filtered matches that rank below many unfiltered ones are still paged and counted"""
+    rows = [
+        {
+            "name_with_owner": f"test/tool-{i}",
+            "name": f"tool-{i}",
+            "owner": "test",
+            "description": "tool tool tool",
+            "primary_language": "Go",
+            "stargazer_count": 10,
+        }
+        for i in range(99)
+    ]
+    # Only a summary hit, so it ranks last among all 100 matches
+    rows.append({
+        "name_with_owner": "test/weak-match",
+        "name": "weak-match",
+        "owner": "test",
+        "summary": "also usable as a tool",
+        "primary_language": "Python",
+        "stargazer_count": 500,
+    })
+    await db.add_repositories_bulk(rows)
+
+    result = await db.search_repositories_fulltext("tool", limit=5, languages=["Python"], return_count=True)
+    assert result["total"] == 1
+    assert [r["name_with_owner"] for r in result["results"]] == ["test/weak-match"]
+
+    result = await db.search_repositories_fulltext("tool", limit=5, min_stars=90, return_count=True)
+    assert result["total"] == len(result["results"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_fts_update_trigger_only_on_indexed_columns(db):
+    """Test the FTS index follows description edits and ignores other columns"""
+    await db.add_repository({
+        "name_with_owner": "test/renamed-tool",
+        "name": "renamed-tool",
+        "owner": "test",
+        "description": "oldkeyword utility",
+    })
+
+    await db.update_repository("test/renamed-tool", {"description": "newkeyword utility"})
+    assert await db.search_repositories_fulltext("oldkeyword") == []
+    assert len(await db.search_repositories_fulltext("newkeyword")) == 1
+
+    async with db._connection.execute(
+        "SELECT sql FROM sqlite_master WHERE type='trigger' AND name='repositories_au'"
+    ) as cursor:
+        trigger_sql = (await cursor.fetchone())[0]
+    assert "UPDATE OF name_with_owner, name, description, summary" in trigger_sql
+
+
+@pytest.mark.asyncio
+async def test_fts_search_weights_name_over_summary(db):
+    """Test name matches rank above summary-only matches"""
+    await db.add_repository({
+        "name_with_owner": "test/helper-lib",
+        "name": "helper-lib",
+        "owner": "test",
+        "description": "Utilities",
+        "summary": "Works great with kubernetes clusters and kubernetes operators",
+    })
+    await db.add_repository({
+        "name_with_owner": "test/kubernetes",
+        "name": "kubernetes",
+        "owner": "test",
+        "description": "Container orchestration",
+    })
+
+    results = await db.search_repositories_fulltext("kubernetes")
+    assert results[0]["name_with_owner"] == "test/kubernetes"
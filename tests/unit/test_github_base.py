@@ -0,0 +1,49 @@
+import time
+
+import httpx
+
+from src.github.base import GitHubBaseClient, RATE_LIMIT_LOW_WATER, RATE_LIMIT_MAX_WAIT
+
+
+def _response(status_code: int, headers: dict) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers)
+
+
+def test_rate_limit_wait_uses_retry_after():
+    """Test secondary rate limits honour Retry-After"""
+    client = GitHubBaseClient(token="test_token")
+    assert client._rate_limit_wait(_response(429, {"Retry-After": "5"})) == 5.0
+
+
+def test_rate_limit_wait_uses_reset_when_exhausted():
+    """Test primary rate limit waits until X-RateLimit-Reset, within the cap"""
+    client = GitHubBaseClient(token="test_token")
+    soon = _response(403, {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(int(time.time()) + 10),
+    })
+    later = _response(403, {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(int(time.time() + RATE_LIMIT_MAX_WAIT) + 600),
+    })
+
+    assert 0 < client._rate_limit_wait(soon) <= 11
+    assert client._rate_limit_wait(later) is None
+    # A plain 403 (e.g. bad token) is not retried
+    assert client._rate_limit_wait(_response(403, {})) is None
+    assert client._rate_limit_wait(_response(502, {"Retry-After": "5"})) is None
+
+
+def test_throttle_wait_paces_low_budget():
+    """Test successful responses are paced only when few points remain"""
+    client = GitHubBaseClient(token="test_token")
+    reset = str(int(time.time()) + 100)
+
+    healthy = _response(200, {"X-RateLimit-Remaining": str(RATE_LIMIT_LOW_WATER), "X-RateLimit-Reset": reset})
+    low = _response(200, {"X-RateLimit-Remaining": "9", "X-RateLimit-Reset": reset})
+    empty = _response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+
+    assert client._throttle_wait(healthy) is None
+    assert client._throttle_wait(_response(200, {})) is None
+    assert 8 <= client._throttle_wait(low) <= 10
+    assert client._throttle_wait(empty) == RATE_LIMIT_MAX_WAIT
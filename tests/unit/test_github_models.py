@@ -48,6 +48,44 @@ def test_repository_owner_login_extraction():
     assert repo.owner_login == "test"
 
 
+def test_repository_iso_timestamps():
+    """Test ISO timestamp properties match isoformat() and handle None"""
+    repo = GitHubRepository(
+        id=1,
+        name_with_owner="test/repo",
+        name="repo",
+        owner="test",
+        stargazer_count=0,
+        fork_count=0,
+        url="https://github.com/test/repo",
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+        pushed_at=datetime(2024, 1, 3, 12, 30)
+    )
+    assert repo.pushed_at_iso == "2024-01-03T12:30:00"
+    assert repo.created_at_iso == "2024-01-01T00:00:00"
+    assert repo.starred_at_iso is None
+    assert "pushed_at_iso" not in repo.model_dump()
+
+
+def test_repository_languages_dump_is_cached():
+    """Test languages are dumped to dicts once per instance"""
+    repo = GitHubRepository(
+        id=1,
+        name_with_owner="test/repo",
+        name="repo",
+        owner="test",
+        stargazer_count=0,
+        fork_count=0,
+        url="https://github.com/test/repo",
+        created_at="2024-01-01T00:00:00Z",
+        updated_at="2024-01-01T00:00:00Z",
+        languages=[{"name": "Python", "size": 100, "percent": 100.0}]
+    )
+    assert repo.languages_dump == [{"name": "Python", "size": 100, "percent": 100.0}]
+    assert repo.languages_dump is repo.languages_dump
+
+
 def test_repository_analysis_model():
     """Test repository analysis model"""
     analysis = RepositoryAnalysis(
@@ -187,3 +187,42 @@ async def test_bm25_score_normalization():
     assert repo1["fts_score"] > repo2["fts_score"], \
         "Better BM25 match should have higher normalized score"
 
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_excludes_archived_before_top_k():
+    """Test archived repos are dropped from candidates so top_k stays filled."""
+    db = MagicMock()
+    db.search_repositories = AsyncMock(return_value=[])
+    db.execute_query = AsyncMock(return_value=[])
+    db.filter_repository_names = AsyncMock(return_value=["sem/active"])
+
+    semantic = MagicMock()
+    semantic.search = AsyncMock(return_value=[
+        {"name_with_owner": "sem/archived", "similarity_score": 0.9},
+        {"name_with_owner": "sem/active", "similarity_score": 0.5}
+    ])
+
+    hybrid = HybridSearch(db, semantic)
+    results = await hybrid.search("test query", top_k=1, exclude_archived=True)
+
+    assert [r["name_with_owner"] for r in results] == ["sem/active"]
+    db.filter_repository_names.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_pushes_language_filter_to_semantic():
+    """Test language filters are forwarded to the vector store query."""
+    db = MagicMock()
+    db.search_repositories = AsyncMock(return_value=[])
+    db.execute_query = AsyncMock(return_value=[])
+
+    semantic = MagicMock()
+    semantic.search = AsyncMock(return_value=[])
+
+    hybrid = HybridSearch(db, semantic)
+    await hybrid.search("test query", languages=["Python", "Go"])
+
+    assert semantic.search.call_args.kwargs["where"] == {
+        "primary_language": {"$in": ["Python", "Go"]}
+    }
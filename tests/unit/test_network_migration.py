@@ -70,3 +70,22 @@ async def test_migration_is_idempotent(db):
     # Verify migration was recorded
     assert result is not None
     assert result[0] == "002_add_network_cache.sql"
+
+
+@pytest.mark.asyncio
+async def test_network_topn_query_uses_covering_index(db):
+    """Test that the build_network top-N query is answered from the covering index"""
+    cursor = await db._connection.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT name_with_owner, description, stargazer_count, categories, primary_language
+        FROM repositories
+        WHERE stargazer_count IS NOT NULL
+        ORDER BY stargazer_count DESC
+        LIMIT 100
+        """
+    )
+    plan = " ".join(row[3] for row in await cursor.fetchall())
+
+    assert "COVERING INDEX idx_repos_network_topn" in plan
+    assert "TEMP B-TREE" not in plan
@@ -1,3 +1,7 @@
+import json
+import threading
+
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from src.services.network import NetworkService
@@ -127,6 +131,32 @@ async def test_build_network_creates_nodes_and_edges():
     assert "size" in node
     assert "color" in node
 
+@pytest.mark.asyncio
+async def test_build_network_loads_embeddings_off_event_loop():
+    db = MagicMock()
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall = AsyncMock(return_value=[
+        ("owner/repo1", "Repo 1", 1000, '["AI"]', "Python"),
+        ("owner/repo2", "Repo 2", 500, '["AI"]', "Python"),
+    ])
+    db._connection.execute = AsyncMock(return_value=mock_cursor)
+
+    loop_thread = threading.get_ident()
+    get_threads = []
+
+    def collection_get(ids, include):
+        get_threads.append(threading.get_ident())
+        return {"ids": ids, "embeddings": [[1.0, 0.0], [1.0, 0.0]]}
+
+    semantic = MagicMock()
+    semantic.collection.get.side_effect = collection_get
+
+    service = NetworkService(db, semantic=semantic)
+    network = await service.build_network(top_n=2, k=1)
+
+    assert get_threads and loop_thread not in get_threads
+    assert len(network["edges"]) >= 1
+
 @pytest.mark.asyncio
 async def test_save_and_load_cached_network():
     db = MagicMock()
@@ -190,3 +220,84 @@ async def test_get_cached_network_handles_corrupted_cache():
     # Verify DELETE was called to clean up corrupted cache
     assert db._connection.execute.call_count == 2  # SELECT + DELETE
     assert db._connection.commit.called
+
+def test_semantic_matrix_from_quantized_embeddings():
+    embeddings = np.array([
+        [1.0, 0.0, 0.0],
+        [2.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [-1.0, 0.0, 0.0],
+    ], dtype=np.float32)
+
+    quantized = NetworkService._quantize_embeddings(embeddings)
+    assert quantized.dtype == np.int8
+
+    similarity = NetworkService._semantic_matrix(quantized)
+
+    # Same direction -> ~1.0, orthogonal -> 0, opposite clamped to 0
+    assert abs(similarity[0, 1] - 1.0) < 0.01
+    assert similarity[0, 2] == 0.0
+    assert similarity[0, 3] == 0.0
+    # No self-edges
+    assert similarity[0, 0] == 0.0
+
+def test_get_color_by_stars_buckets():
+    service = NetworkService(MagicMock())
+
+    assert service._get_color_by_stars(0) == "hsl(120, 70%, 50%)"
+    assert service._get_color_by_stars(5000) == "hsl(60, 70%, 50%)"
+    assert service._get_color_by_stars(10000) == "hsl(0, 70%, 50%)"
+    assert service._get_color_by_stars(250000) == "hsl(0, 70%, 50%)"
+
+def test_jaccard_matrix_matches_pairwise():
+    repos = [
+        {"categories": ["AI", "ML"]},
+        {"categories": ["AI", "ML", "DL"]},
+        {"categories": ["Web"]},
+        {"categories": []},
+    ]
+
+    jaccard = NetworkService._jaccard_matrix(repos)
+
+    for i, repo_a in enumerate(repos):
+        for j, repo_b in enumerate(repos):
+            expected = 0.0 if i == j else NetworkService._jaccard(repo_a, repo_b)
+            assert abs(jaccard[i, j] - expected) < 1e-9
+
+@pytest.mark.asyncio
+async def test_saved_network_round_trips_through_columnar_cache():
+    db = MagicMock()
+    db._connection.execute = AsyncMock()
+    db._connection.commit = AsyncMock()
+
+    service = NetworkService(db, semantic=None)
+
+    network_data = {
+        "nodes": [
+            {"id": "owner/a", "name": "a", "size": 2, "categories": ["AI", "ML"]},
+            {"id": "owner/b", "name": "b", "size": 1, "categories": ["AI"]},
+        ],
+        "edges": [{"source": "owner/a", "target": "owner/b", "strength": 0.5}]
+    }
+
+    await service.save_network(network_data, top_n=100, k=5)
+    nodes_json, edges_json = db._connection.execute.call_args[0][1][:2]
+
+    # Stored as parallel columns
+    assert json.loads(nodes_json)["id"] == ["owner/a", "owner/b"]
+
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone = AsyncMock(return_value=(nodes_json, edges_json))
+    db._connection.execute = AsyncMock(return_value=mock_cursor)
+
+    network = await service.get_cached_network()
+
+    assert network["nodes"] == network_data["nodes"]
+    assert network["edges"] == network_data["edges"]
+
+def test_top_k_indices_orders_by_strength():
+    row = np.array([0.1, 0.9, 0.0, 0.5, 0.9])
+
+    assert list(NetworkService._top_k_indices(row, 3)) == [1, 4, 3]
+    # k larger than the row falls back to ordering every index
+    assert list(NetworkService._top_k_indices(row, 10)) == [1, 4, 3, 0, 2]
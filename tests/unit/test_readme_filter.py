@@ -1,5 +1,5 @@
 import pytest
-from src.vector.readme_filter import extract_readme_summary
+from src.vector.readme_filter import BADGE_RE, extract_readme_summary
 
 def test_extract_summary_removes_installation_section():
     """测试过滤 Installation 章节"""
@@ -60,3 +60,20 @@ def test_exact_section_title_match():
     result = extract_readme_summary(readme, max_length=500)
     assert "Getting Started" not in result
     assert "npm start" not in result
+
+def test_badge_pattern_strips_linked_badges_only():
+    """测试移除带链接的徽章，保留普通链接"""
+    text = "[![CI](https://ci/badge.svg)](https://ci) ![Logo](logo.png) [Docs](https://docs) text"
+    assert BADGE_RE.sub("", text) == "  [Docs](https://docs) text"
+
+def test_badge_pattern_unterminated_line_is_fast():
+    """测试未闭合的徽章语法不会导致回溯爆炸"""
+    text = "[![" * 5000 + "\n" + "![a](" * 5000
+    assert BADGE_RE.sub("", text) == text
+
+def test_extract_summary_stops_at_length_limit():
+    """测试超长 README 达到长度上限后直接截断返回"""
+    readme = "# Project\n" + "\n".join(f"line {i} of the overview" for i in range(10000))
+    result = extract_readme_summary(readme, max_length=100)
+    assert len(result) == 100
+    assert result.startswith("# Project\nline 0")
@@ -26,6 +26,14 @@ async def test_search_service_with_hybrid_search(db):
         }
     ])
 
+    # Filters are applied against the stored rows
+    await db.add_repository({
+        "name_with_owner": "owner/repo1",
+        "name": "repo1",
+        "owner": "owner",
+        "primary_language": "Python",
+    })
+
     service = SearchService(db, mock_hybrid)
     assert service.hybrid_search is not None
 
@@ -91,6 +99,16 @@ async def test_search_with_hybrid_and_filters(db):
         }
     ])
 
+    # Filters are applied against the stored rows
+    for name, language, stars in [("owner/repo1", "Python", 100), ("owner/repo2", "TypeScript", 50)]:
+        await db.add_repository({
+            "name_with_owner": name,
+            "name": name.split("/")[1],
+            "owner": "owner",
+            "primary_language": language,
+            "stargazer_count": stars,
+        })
+
     service = SearchService(db, mock_hybrid)
 
     # Search with language filter
@@ -177,6 +195,61 @@ async def test_get_similar_repositories(db):
     assert similar[0]["name_with_owner"] == "owner/repo2"
 
 
+@pytest.mark.asyncio
+async def test_get_similar_repositories_cached_until_data_changes(db):
+    """Test similar-repo results are memoized and refreshed after writes"""
+    service = SearchService(db)
+
+    for name, stars in [("owner/repo1", 100), ("owner/repo2", 50)]:
+        await db.add_repository({
+            "name_with_owner": name,
+            "name": name.split("/")[1],
+            "owner": "owner",
+            "primary_language": "Python",
+            "stargazer_count": stars,
+        })
+
+    first = await service.get_similar_repositories("owner/repo1")
+    first[0]["name_with_owner"] = "mutated"
+
+    db.search_repositories = AsyncMock(side_effect=AssertionError("not cached"))
+    second = await service.get_similar_repositories("owner/repo1")
+    assert [r["name_with_owner"] for r in second] == ["owner/repo2"]
+
+    del db.search_repositories
+    await db.add_repository({
+        "name_with_owner": "owner/repo3",
+        "name": "repo3",
+        "owner": "owner",
+        "primary_language": "Python",
+        "stargazer_count": 10,
+    })
+    third = await service.get_similar_repositories("owner/repo1")
+    assert {r["name_with_owner"] for r in third} == {"owner/repo2", "owner/repo3"}
+
+
+@pytest.mark.asyncio
+async def test_get_similar_repositories_cache_isolated_from_nested_mutation(db):
+    """Test mutating nested lists in a result doesn't leak into the cache"""
+    service = SearchService(db)
+
+    for name, stars in [("owner/repo1", 100), ("owner/repo2", 50)]:
+        await db.add_repository({
+            "name_with_owner": name,
+            "name": name.split("/")[1],
+            "owner": "owner",
+            "primary_language": "Python",
+            "stargazer_count": stars,
+            "categories": ["工具"],
+        })
+
+    first = await service.get_similar_repositories("owner/repo1")
+    first[0]["categories"].append("mutated")
+
+    second = await service.get_similar_repositories("owner/repo1")
+    assert second[0]["categories"] == ["工具"]
+
+
 @pytest.mark.asyncio
 async def test_get_similar_repositories_nonexistent(db):
     """Test finding similar repos for non-existent repo"""
@@ -204,3 +277,50 @@ async def test_get_categories(db):
     categories = await service.get_categories()
     assert "工具" in categories
     assert categories["工具"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_search_with_relations_includes_related(db):
+    """Test related repos are collected from graph edges of the results"""
+    service = SearchService(db)
+
+    for name, category in [("owner/repo1", "工具"), ("owner/repo2", "后端"), ("owner/repo3", "后端")]:
+        await db.add_repository({
+            "name_with_owner": name,
+            "name": name.split("/")[1],
+            "owner": "owner",
+            "stargazer_count": 100,
+            "categories": [category],
+        })
+
+    await db.batch_insert_graph_edges([
+        {"source_repo": "owner/repo1", "target_repo": "owner/repo2", "edge_type": "semantic", "weight": 0.9},
+        {"source_repo": "owner/repo1", "target_repo": "owner/repo3", "edge_type": "semantic", "weight": 0.5},
+    ])
+
+    result = await service.search_with_relations(categories=["工具"])
+
+    assert [r["name_with_owner"] for r in result["results"]] == ["owner/repo1"]
+    assert [r["name_with_owner"] for r in result["related"]] == ["owner/repo2", "owner/repo3"]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_offset_keeps_full_total(db):
+    """Test hybrid paging slices once and reports the full result count"""
+    mock_hybrid = MagicMock()
+    mock_hybrid.search = AsyncMock(return_value=[
+        {"name_with_owner": f"owner/repo{i}", "final_score": 1 - i / 10}
+        for i in range(5)
+    ])
+
+    service = SearchService(db, mock_hybrid)
+
+    result = await service.search(query="test", limit=2, offset=2, return_count=True)
+    assert [r["name_with_owner"] for r in result["results"]] == ["owner/repo2", "owner/repo3"]
+    assert result["total"] == 5
+
+    next_page = await service.search(
+        query="test", limit=2, return_count=True, after=result["next_cursor"]
+    )
+    assert [r["name_with_owner"] for r in next_page["results"]] == ["owner/repo4"]
+    assert next_page["next_cursor"] is None
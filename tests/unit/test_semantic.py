@@ -11,7 +11,6 @@ async def test_semantic_search_add_repos():
 
         # Mock collection
         semantic.collection = MagicMock()
-        semantic.collection.add = MagicMock()
 
         repos = [
             {
@@ -29,7 +28,10 @@ async def test_semantic_search_add_repos():
 
             await semantic.add_repositories(repos)
 
-            assert semantic.collection.add.called
+            # upsert, so re-adding a repository replaces its vector
+            semantic.collection.upsert.assert_called_once()
+            assert semantic.collection.upsert.call_args.kwargs["ids"] == ["test/repo1"]
+            assert not semantic.collection.add.called
 
 
 @pytest.mark.asyncio
@@ -139,3 +141,20 @@ def test_repo_to_text_empty():
     text = semantic._repo_to_text(repo)
 
     assert "test" in text
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_delete_repositories_batch():
+    """Test deleting several repositories issues one collection delete."""
+    with patch('src.vector.semantic.chromadb.PersistentClient'):
+        semantic = SemanticSearch()
+
+        semantic.collection = MagicMock()
+        semantic.collection.delete = MagicMock()
+
+        await semantic.delete_repositories(["test/repo1", "", "test/repo2"])
+        semantic.collection.delete.assert_called_once_with(ids=["test/repo1", "test/repo2"])
+
+        semantic.collection.delete.reset_mock()
+        await semantic.delete_repositories([])
+        assert not semantic.collection.delete.called
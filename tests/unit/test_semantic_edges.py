@@ -102,3 +102,20 @@ async def test_discover_and_store_edges_full_rebuild(mock_semantic_search, mock_
 
     # Verify all old semantic edges were deleted once (batch delete at start)
     assert mock_db.execute_query.call_count == 1  # 1 batch delete for all semantic edges
+
+
+@pytest.mark.asyncio
+async def test_update_edges_for_repos_batches_writes(mock_semantic_search, mock_db):
+    """Test batch edge updates use one delete and one insert for all repos."""
+    discovery = SemanticEdgeDiscovery(mock_semantic_search, mock_db)
+
+    await discovery.update_edges_for_repos(["test/a", "test/b"], top_k=10)
+
+    mock_db.execute_query.assert_awaited_once()
+    query, params = mock_db.execute_query.await_args.args
+    assert "IN (?,?)" in query
+    assert params == ("test/a", "test/b", "test/a", "test/b")
+    assert mock_semantic_search.get_similar_repos.await_count == 2
+    mock_db.batch_insert_graph_edges.assert_awaited_once()
+    edges = mock_db.batch_insert_graph_edges.await_args.args[0]
+    assert [e["source_repo"] for e in edges] == ["test/a", "test/a", "test/b", "test/b"]
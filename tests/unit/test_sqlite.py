@@ -1,7 +1,7 @@
 import pytest
 import pytest_asyncio
 from aiosqlite import Error as AiosqliteError
-from src.db.sqlite import SQLiteDatabase
+from src.db.sqlite import PAGE_CACHE_KIB, SQLiteDatabase
 
 
 @pytest_asyncio.fixture
@@ -27,6 +27,22 @@ async def test_initialize_creates_tables(db):
     assert "messages" in tables
 
 
+@pytest.mark.asyncio
+async def test_file_database_uses_wal(tmp_path):
+    """Test file databases run in WAL mode with synchronous=NORMAL and a larger page cache"""
+    file_db = SQLiteDatabase(str(tmp_path / "starship.db"))
+    await file_db.initialize()
+    try:
+        async with file_db._connection.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == "wal"
+        async with file_db._connection.execute("PRAGMA synchronous") as cursor:
+            assert (await cursor.fetchone())[0] == 1  # NORMAL
+        async with file_db._connection.execute("PRAGMA cache_size") as cursor:
+            assert (await cursor.fetchone())[0] == -PAGE_CACHE_KIB
+    finally:
+        await file_db.close()
+
+
 @pytest.mark.asyncio
 async def test_add_repository(db):
     """Test adding a repository"""
@@ -190,3 +206,231 @@ async def test_batch_insert_graph_edges(db):
         "SELECT * FROM graph_edges WHERE source_repo = 'repo1'"
     )
     assert len(result) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_repositories_preserves_order(db):
+    """Test fetching several repositories in one query"""
+    for name in ["owner/a", "owner/b", "owner/c"]:
+        await db.add_repository({
+            "name_with_owner": name,
+            "name": name.split("/")[1],
+            "owner": "owner",
+            "categories": ["工具"],
+        })
+
+    repos = await db.get_repositories(["owner/c", "missing/repo", "owner/a"])
+
+    assert [r["name_with_owner"] for r in repos] == ["owner/c", "owner/a"]
+    assert repos[0]["categories"] == ["工具"]
+    assert await db.get_repositories([]) == []
+
+
+@pytest.mark.asyncio
+async def test_add_repositories_bulk(db):
+    """Test inserting several repositories in one batch"""
+    added = await db.add_repositories_bulk([
+        {"name_with_owner": "owner/a", "name": "a", "owner": "owner", "categories": ["工具"]},
+        {"name_with_owner": "owner/b", "name": "b", "owner": "owner", "topics": ["cli"]},
+    ])
+
+    assert added == 2
+    repos = await db.get_repositories(["owner/a", "owner/b"])
+    assert repos[1]["topics"] == ["cli"]
+    assert [r["name_with_owner"] for r in await db.search_repositories(categories=["工具"])] == ["owner/a"]
+    assert await db.add_repositories_bulk([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_add_repositories_bulk_falls_back_per_row(db):
+    """Test a duplicate row only drops itself, not the whole batch"""
+    await db.add_repository({"name_with_owner": "owner/a", "name": "a", "owner": "owner"})
+
+    added = await db.add_repositories_bulk([
+        {"name_with_owner": "owner/a", "name": "a", "owner": "owner"},
+        {"name_with_owner": "owner/b", "name": "b", "owner": "owner"},
+    ])
+
+    assert added == 1
+    assert await db.get_repository("owner/b") is not None
+
+    names = await db.add_repositories_bulk([
+        {"name_with_owner": "owner/b", "name": "b", "owner": "owner"},
+        {"name_with_owner": "owner/c", "name": "c", "owner": "owner"},
+    ], return_names=True)
+    assert names == ["owner/c"]
+
+
+@pytest.mark.asyncio
+async def test_iter_repositories_pages_through_all_rows(db):
+    """Test iterating repositories across keyset batches"""
+    for i in range(5):
+        await db.add_repository({
+            "name_with_owner": f"owner/repo{i}",
+            "name": f"repo{i}",
+            "owner": "owner",
+            "archived": i == 0,
+        })
+    await db.execute("UPDATE repositories SET is_deleted = 1 WHERE name_with_owner = 'owner/repo4'")
+
+    names = [r["name_with_owner"] async for r in db.iter_repositories(batch_size=2)]
+
+    # Archived rows are included, deleted rows are not
+    assert names == ["owner/repo0", "owner/repo1", "owner/repo2", "owner/repo3"]
+    assert len([r async for r in db.iter_repositories(is_deleted=None, batch_size=2)]) == 5
+
+    projected = [r async for r in db.iter_repositories(columns=["stargazer_count", "languages"])]
+    assert set(projected[0]) == {"name_with_owner", "stargazer_count", "languages"}
+
+
+@pytest.mark.asyncio
+async def test_update_repositories_bulk(db):
+    """Test updating rows with different column sets in one batch"""
+    for name in ["owner/a", "owner/b"]:
+        await db.add_repository({"name_with_owner": name, "name": name.split("/")[1], "owner": "owner"})
+
+    updated = await db.update_repositories_bulk([
+        ("owner/a", {"stargazer_count": 5}),
+        ("owner/b", {"description": "new", "topics": ["cli"]}),
+    ])
+
+    assert updated == 2
+    assert (await db.get_repository("owner/a"))["stargazer_count"] == 5
+    assert (await db.get_repository("owner/b"))["topics"] == ["cli"]
+    assert await db.update_repositories_bulk([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_repositories(db):
+    """Test deleting several repositories with one statement"""
+    for name in ["owner/a", "owner/b", "owner/c"]:
+        await db.add_repository({
+            "name_with_owner": name,
+            "name": name.split("/")[1],
+            "owner": "owner",
+            "categories": ["工具"],
+        })
+
+    deleted = await db.delete_repositories(["owner/a", "owner/c", "missing/repo"])
+
+    assert deleted == 2
+    assert [r["name_with_owner"] for r in await db.search_repositories(categories=["工具"])] == ["owner/b"]
+    assert await db.delete_repositories([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_graph_edges_bulk(db):
+    """Test fetching top edges for several repositories in one query"""
+    for name in ["repo1", "repo2", "repo3", "repo4"]:
+        await db.add_repository({"name_with_owner": name, "name": name, "owner": "owner"})
+
+    await db.batch_insert_graph_edges([
+        {"source_repo": "repo1", "target_repo": "repo2", "edge_type": "semantic", "weight": 0.5},
+        {"source_repo": "repo1", "target_repo": "repo3", "edge_type": "semantic", "weight": 0.9},
+        {"source_repo": "repo1", "target_repo": "repo4", "edge_type": "author", "weight": 0.1},
+        {"source_repo": "repo2", "target_repo": "repo1", "edge_type": "semantic", "weight": 0.7},
+    ])
+
+    edges = await db.get_graph_edges_bulk(["repo1", "repo2", "repo3"], limit=2)
+
+    assert [e["target_repo"] for e in edges["repo1"]] == ["repo3", "repo2"]
+    assert [e["target_repo"] for e in edges["repo2"]] == ["repo1"]
+    assert edges["repo3"] == []
+
+
+@pytest.mark.asyncio
+async def test_filter_repository_names(db):
+    """Test filtering candidate names in SQL keeps the given order"""
+    await db.add_repository({"name_with_owner": "o/a", "name": "a", "owner": "o",
+                             "primary_language": "Python", "stargazer_count": 10,
+                             "categories": ["工具"]})
+    await db.add_repository({"name_with_owner": "o/b", "name": "b", "owner": "o",
+                             "primary_language": "Go", "stargazer_count": 500,
+                             "categories": ["工具"]})
+    await db.add_repository({"name_with_owner": "o/c", "name": "c", "owner": "o",
+                             "primary_language": "Python", "stargazer_count": 300,
+                             "categories": ["测试"]})
+
+    names = ["o/c", "o/b", "o/a"]
+
+    assert await db.filter_repository_names(names, categories=["工具"]) == ["o/b", "o/a"]
+    assert await db.filter_repository_names(names, languages=["Python"], min_stars=100) == ["o/c"]
+
+
+@pytest.mark.asyncio
+async def test_search_repositories_keyset_pagination(db):
+    """Test paging with next_cursor returns every row exactly once"""
+    starred = ["2024-01-03", "2024-01-02", "2024-01-02", None, "2024-01-01"]
+    for i, starred_at in enumerate(starred):
+        await db.add_repository({
+            "name_with_owner": f"owner/repo{i}",
+            "name": f"repo{i}",
+            "owner": "owner",
+            "starred_at": starred_at,
+        })
+
+    for sort_order in ("DESC", "ASC"):
+        seen = []
+        after = None
+        while True:
+            page = await db.search_repositories(
+                limit=2, sort_order=sort_order, return_count=True, after=after
+            )
+            assert page["total"] == 5
+            seen.extend(r["name_with_owner"] for r in page["results"])
+            after = page["next_cursor"]
+            if after is None:
+                break
+
+        offset_rows = await db.search_repositories(limit=10, sort_order=sort_order)
+        assert seen == [r["name_with_owner"] for r in offset_rows]
+        assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_search_repositories_active_and_new_filters(db):
+    """Test is_active / is_new compare timestamps as epochs across ISO formats"""
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    old = (now - timedelta(days=400)).isoformat()
+
+    await db.add_repository({"name_with_owner": "o/fresh", "name": "fresh", "owner": "o",
+                             "pushed_at": recent, "created_at": recent})
+    await db.add_repository({"name_with_owner": "o/stale", "name": "stale", "owner": "o",
+                             "pushed_at": old, "created_at": old})
+
+    await db.execute(
+        "UPDATE repositories SET created_at = ? WHERE name_with_owner = ?",
+        (old, "o/stale")
+    )
+
+    active = await db.search_repositories(is_active=True)
+    assert [r["name_with_owner"] for r in active] == ["o/fresh"]
+
+    new = await db.search_repositories(is_new=True)
+    assert [r["name_with_owner"] for r in new] == ["o/fresh"]
+
+    async with db._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT r.name_with_owner FROM repositories r "
+        "WHERE CAST(strftime('%s', r.pushed_at) AS INTEGER) >= ?",
+        (0,)
+    ) as cursor:
+        plan = " ".join(row[3] for row in await cursor.fetchall())
+    assert "idx_repos_pushed_at_epoch" in plan
+
+
+@pytest.mark.asyncio
+async def test_search_repositories_return_count(db):
+    """Test total count with the page, including pages past the end"""
+    for i in range(3):
+        await db.add_repository({"name_with_owner": f"o/r{i}", "name": f"r{i}", "owner": "o"})
+
+    page = await db.search_repositories(limit=2, return_count=True)
+    assert page["total"] == 3
+    assert len(page["results"]) == 2
+    assert "_total" not in page["results"][0]
+
+    past_end = await db.search_repositories(limit=2, offset=10, return_count=True)
+    assert past_end == {"results": [], "total": 3, "next_cursor": None}
@@ -2,16 +2,18 @@
 Unit tests for SyncService.
 
 Tests the core synchronization logic including:
-- Change detection (_should_update_repo)
+- Change detection (_diff_batch)
 - Soft delete and restore operations
 - Full and incremental sync
 - Vector index updates with semantic_search
 """
+import asyncio
+
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
 
-from src.services.sync import SyncService
+from src.services.sync import ERROR_SUMMARY_LIMIT, SYNC_DIFF_COLUMNS, SyncService
 from src.github.models import GitHubRepository
 
 
@@ -28,6 +30,7 @@ def sync_service_with_semantic(db):
     mock_semantic.add_repositories = AsyncMock()
     mock_semantic.update_repository = AsyncMock()
     mock_semantic.delete_repository = AsyncMock()
+    mock_semantic.delete_repositories = AsyncMock()
     return SyncService(db, mock_semantic)
 
 
@@ -117,162 +120,94 @@ def sample_local_repo():
 
 
 # ============================================================================
-# _should_update_repo() tests
+# _diff_batch() tests
 # ============================================================================
 
 class TestNeedsUpdate:
-    """Tests for _should_update_repo method."""
+    """Tests for change detection in _diff_batch."""
 
-    @pytest.mark.asyncio
-    async def test_no_changes_needed(self, sync_service, sample_local_repo, sample_github_repo):
-        """Test that identical repos don't need update."""
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": sample_github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
+    @staticmethod
+    def _needs_update(sync_service, github_repo, local_repo) -> bool:
+        return bool(sync_service._diff_batch(
+            common_names={"owner/test-repo"},
+            github_repo_map={"owner/test-repo": github_repo},
+            local_repo_map={"owner/test-repo": local_repo},
             stats={"failed": 0, "errors": []},
             skip_llm=True
-        )
+        ))
+
+    def test_no_changes_needed(self, sync_service, sample_local_repo, sample_github_repo):
+        """Test that identical repos don't need update."""
+        result = self._needs_update(sync_service, sample_github_repo, sample_local_repo)
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_pushed_at_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_pushed_at_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
         """Test that pushed_at changes trigger update."""
         github_repo = github_repo_factory(pushed_at=datetime(2023, 12, 2))
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_stargazer_count_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_stargazer_count_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
         """Test that stargazer_count changes trigger update."""
         github_repo = github_repo_factory(stargazer_count=101)
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_fork_count_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_fork_count_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
         """Test that fork_count changes trigger update."""
         github_repo = github_repo_factory(fork_count=21)
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_language_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_language_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
         """Test that primary_language changes trigger update."""
         github_repo = github_repo_factory(primary_language="TypeScript")
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_description_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_description_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
         """Test that description changes trigger update."""
         github_repo = github_repo_factory(description="Updated description")
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_archived_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_archived_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
         """Test that archived status changes trigger update."""
         github_repo = github_repo_factory(archived=True)
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_visibility_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_visibility_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
         """Test that visibility changes trigger update."""
         github_repo = github_repo_factory(visibility="private")
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_owner_type_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_owner_type_change_triggers_update(self, sync_service, sample_local_repo, github_repo_factory):
         """Test that owner_type changes trigger update."""
         github_repo = github_repo_factory(owner_type="Organization")
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_handles_null_pushed_at_in_github_repo(self, sync_service, sample_local_repo, github_repo_factory):
+    def test_handles_null_pushed_at_in_github_repo(self, sync_service, sample_local_repo, github_repo_factory):
         """Test handling of null pushed_at in GitHub repo."""
         github_repo = github_repo_factory()
         # Explicitly set pushed_at to None after creation
         github_repo.pushed_at = None
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": sample_local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, sample_local_repo)
         assert result is True  # Should trigger update due to null
 
-    @pytest.mark.asyncio
-    async def test_handles_null_pushed_at_in_local_repo(self, sync_service, sample_github_repo):
+    def test_handles_null_pushed_at_in_local_repo(self, sync_service, sample_github_repo):
         """Test handling of null pushed_at in local repo."""
         local_repo = {
             **sample_github_repo.model_dump(),
             "pushed_at": None,
             "languages": [{"name": "Python", "size": 1000, "percent": 100.0}]
         }
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": sample_github_repo},
-            local_repo_map={"owner/test-repo": local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, sample_github_repo, local_repo)
         assert result is True  # Should trigger update due to null
 
-    @pytest.mark.asyncio
-    async def test_handles_null_language(self, sync_service, github_repo_factory):
+    def test_handles_null_language(self, sync_service, github_repo_factory):
         """Test handling of null primary_language."""
         local_repo = {
             "name_with_owner": "owner/test-repo",
@@ -287,15 +222,36 @@ class TestNeedsUpdate:
             "languages": []
         }
         github_repo = github_repo_factory(primary_language=None)
-        result = await sync_service._should_update_repo(
-            name="owner/test-repo",
-            github_repo_map={"owner/test-repo": github_repo},
-            local_repo_map={"owner/test-repo": local_repo},
-            stats={"failed": 0, "errors": []},
-            skip_llm=True
-        )
+        result = self._needs_update(sync_service, github_repo, local_repo)
         assert result is True  # Empty languages triggers heavy update
 
+    @pytest.mark.asyncio
+    async def test_sync_index_reports_languages_as_flag(self, sync_service, db, github_repo_factory):
+        """Test that the sync index projection flags languages instead of parsing them."""
+        for name, languages in [("owner/with-langs", [{"name": "Python", "size": 100}]), ("owner/no-langs", [])]:
+            await db.add_repository({
+                "name_with_owner": name,
+                "name": name.split("/")[1],
+                "owner": "owner",
+                "description": "A test repository",
+                "primary_language": "Python",
+                "languages": languages,
+                "stargazer_count": 100,
+                "fork_count": 20,
+                "pushed_at": datetime(2023, 12, 1).isoformat(),
+                "visibility": "public",
+                "owner_type": "User",
+            })
+
+        index = {r["name_with_owner"]: r async for r in db.iter_repositories(columns=SYNC_DIFF_COLUMNS)}
+        assert "languages" not in index["owner/with-langs"]
+        assert index["owner/with-langs"]["has_languages"] == 1
+        assert index["owner/no-langs"]["has_languages"] == 0
+
+        github_repo = github_repo_factory()
+        assert sync_service._detect_changes(index["owner/with-langs"], github_repo)[0] == "none"
+        assert sync_service._detect_changes(index["owner/no-langs"], github_repo)[0] == "heavy"
+
 
 # ============================================================================
 # full_sync() tests
@@ -417,6 +373,92 @@ class TestFullSync:
         assert history["stats_failed"] == 0
 
 
+    @pytest.mark.asyncio
+    async def test_process_updates_writes_batch_and_bounds_index_refresh(self, sync_service_with_semantic, db, mocker, github_repo_factory):
+        """Test that changed repos are written in one batch, re-indexed with bounded concurrency, and edge-updated once."""
+        mocker.patch("src.services.sync.UPDATE_CONCURRENCY", 2)
+        names = ["owner/a", "owner/b", "owner/c", "owner/unchanged"]
+        for name in names:
+            await db.add_repository({
+                "name_with_owner": name,
+                "name": name.split("/")[1],
+                "owner": "owner",
+                "description": "Old description",
+                "primary_language": "Python",
+                "languages": [{"name": "Python", "size": 100}],
+                "stargazer_count": 100,
+                "fork_count": 20,
+                "pushed_at": datetime(2023, 12, 1).isoformat(),
+                "owner_type": "User",
+                "summary": "Kept summary",
+            })
+        local_repo_map = {
+            r["name_with_owner"]: r
+            async for r in db.iter_repositories(columns=SYNC_DIFF_COLUMNS)
+        }
+        github_repo_map = {
+            name: github_repo_factory(
+                name_with_owner=name,
+                name=name.split("/")[1],
+                description="Old description" if name == "owner/unchanged" else "New description",
+            )
+            for name in names
+        }
+
+        running = 0
+        peak = 0
+
+        async def fake_refresh(name, repo=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        mocker.patch.object(sync_service_with_semantic, "_update_vector_index", side_effect=fake_refresh)
+        edges = Mock()
+        edges.update_edges_for_repos = AsyncMock()
+        sync_service_with_semantic.semantic_edge_discovery = edges
+        bulk = mocker.spy(db, "update_repositories_bulk")
+        get_repository = mocker.spy(db, "get_repository")
+        get_repositories = mocker.spy(db, "get_repositories")
+        stats = {"updated": 0, "failed": 0, "errors": []}
+
+        await sync_service_with_semantic._process_updates(github_repo_map, local_repo_map, set(names), stats, skip_llm=True)
+
+        assert stats["updated"] == 3
+        assert stats["failed"] == 0
+        bulk.assert_awaited_once()
+        # The sync index rows are reused; nothing is read back per repo
+        get_repository.assert_not_called()
+        get_repositories.assert_not_called()
+        assert peak == 2
+        await asyncio.sleep(0)
+        edges.update_edges_for_repos.assert_awaited_once()
+        assert sorted(edges.update_edges_for_repos.await_args.args[0]) == ["owner/a", "owner/b", "owner/c"]
+        repo = await db.get_repository("owner/a")
+        assert repo["description"] == "New description"
+        assert repo["summary"] == "Kept summary"
+
+    def test_failures_are_logged_as_one_summary(self, sync_service, mocker):
+        """Test per-repo failures are collected and logged once, truncated."""
+        log_error = mocker.patch("src.services.sync.log_error")
+        stats = {"failed": 0, "errors": []}
+
+        for i in range(ERROR_SUMMARY_LIMIT + 5):
+            sync_service._record_failure(stats, f"owner/repo{i}", ValueError("boom"))
+
+        log_error.assert_not_called()
+        assert stats["failed"] == ERROR_SUMMARY_LIMIT + 5
+
+        sync_service._log_failure_summary(stats)
+        log_error.assert_called_once()
+        message = log_error.call_args.args[0]
+        assert message.startswith(f"{ERROR_SUMMARY_LIMIT + 5} sync errors: owner/repo0: boom")
+        assert message.endswith("(+5 more)")
+
+
 # ============================================================================
 # sync() tests - scenarios
 # ============================================================================
@@ -541,6 +583,60 @@ class TestIncrementalSync:
         assert result["deleted"] == 1  # to-delete-repo
 
 
+    @pytest.mark.asyncio
+    async def test_incremental_sync_fetches_stars_since_cursor(self, sync_service, db, mocker, github_repo_factory):
+        """Test that incremental sync only requests stars newer than the persisted cursor."""
+        await db.execute_query(
+            """INSERT INTO sync_history (sync_type, started_at, completed_at, last_starred_at)
+               VALUES ('full', '2023-06-01T00:00:00', '2023-06-01T00:05:00', '2023-06-01T00:00:00+00:00')"""
+        )
+        new_repo = github_repo_factory(
+            name_with_owner="owner/new-repo",
+            name="new-repo",
+            starred_at=datetime(2023, 7, 1),
+        )
+
+        mock_github = AsyncMock()
+        mock_github.__aenter__ = AsyncMock(return_value=mock_github)
+        mock_github.__aexit__ = AsyncMock()
+        mock_github.get_authenticated_user = AsyncMock(return_value={"login": "testuser"})
+        mock_github.get_starred_repositories = AsyncMock(return_value=[new_repo])
+        mocker.patch("src.github.graphql.GitHubGraphQLClient", return_value=mock_github)
+
+        result = await sync_service.incremental_sync(skip_llm=True)
+
+        since = mock_github.get_starred_repositories.await_args.kwargs["since"]
+        assert since.isoformat() == "2023-06-01T00:00:00+00:00"
+        assert result["sync_type"] == "incremental"
+        assert result["added"] == 1
+        assert await db.get_repository("owner/new-repo") is not None
+
+        # The cursor advances to the newest star seen
+        assert (await sync_service._get_last_starred_at()).isoformat() == "2023-07-01T00:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_sync_with_prefetched_repos_skips_github(self, sync_service, db, mocker, github_repo_factory):
+        """Test that a shared starred listing is used instead of fetching again."""
+        client = mocker.patch("src.github.graphql.GitHubGraphQLClient")
+        github_repo = github_repo_factory(name_with_owner="owner/new-repo", name="new-repo")
+
+        result = await sync_service.full_sync(skip_llm=True, github_repos=[github_repo])
+
+        client.assert_not_called()
+        assert result["added"] == 1
+        assert await db.get_repository("owner/new-repo") is not None
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_without_cursor_runs_full_sync(self, sync_service, mocker):
+        """Test that incremental sync falls back to a full sync on the first run."""
+        full_sync = mocker.patch.object(sync_service, "full_sync", AsyncMock(return_value={"sync_type": "full"}))
+
+        result = await sync_service.incremental_sync(skip_llm=True)
+
+        full_sync.assert_awaited_once_with(skip_llm=True)
+        assert result["sync_type"] == "full"
+
+
 # ============================================================================
 # semantic_search integration tests
 # ============================================================================
@@ -549,120 +645,111 @@ class TestSemanticSearchIntegration:
     """Tests for semantic_search integration in SyncService."""
 
     @pytest.mark.asyncio
-    async def test_add_repository_updates_vector_index(self, sync_service_with_semantic, db, github_repo_factory):
-        """Test that adding a repository also adds it to the vector index."""
-        github_repo = github_repo_factory(
-            name_with_owner="owner/new-repo",
-            name="new-repo",
-            description="A new repository",
-            languages=[],
-            readme_content=None
-        )
-
-        await sync_service_with_semantic._add_repository(github_repo, skip_llm=True)
+    async def test_process_new_repos_adds_batch_to_vector_index(self, sync_service_with_semantic, db, github_repo_factory):
+        """Test that new repositories are inserted and indexed as one batch."""
+        github_repo_map = {
+            name: github_repo_factory(name_with_owner=name, name=name.split("/")[1], languages=[])
+            for name in ["owner/repo1", "owner/repo2"]
+        }
+        stats = {"added": 0, "failed": 0, "errors": []}
 
-        # Verify repo was added to database
-        added_repo = await db.get_repository("owner/new-repo")
-        assert added_repo is not None
+        await sync_service_with_semantic._process_new_repos(github_repo_map, set(github_repo_map), stats, skip_llm=True)
 
-        # Verify vector index was updated
-        assert sync_service_with_semantic.semantic_search.add_repositories.called
+        assert stats["added"] == 2
+        assert stats["failed"] == 0
+        assert await db.get_repository("owner/repo2") is not None
+        add_repositories = sync_service_with_semantic.semantic_search.add_repositories
+        add_repositories.assert_awaited_once()
+        assert len(add_repositories.await_args.args[0]) == 2
 
     @pytest.mark.asyncio
-    async def test_update_repository_with_semantic_field_change(self, sync_service_with_semantic, db, github_repo_factory):
-        """Test that updating semantic fields triggers vector index update."""
-        # Add existing repo
+    async def test_process_new_repos_indexes_only_inserted_rows(self, sync_service_with_semantic, db, github_repo_factory):
+        """Test that rows the database rejected are not added to the vector index."""
+        await db.add_repository({"name_with_owner": "owner/dup", "name": "dup", "owner": "owner"})
+        github_repo_map = {
+            name: github_repo_factory(name_with_owner=name, name=name.split("/")[1], languages=[])
+            for name in ["owner/dup", "owner/fresh"]
+        }
+        stats = {"added": 0, "failed": 0, "errors": []}
+
+        await sync_service_with_semantic._process_new_repos(github_repo_map, set(github_repo_map), stats, skip_llm=True)
+
+        assert stats["added"] == 1
+        assert stats["failed"] == 1
+        add_repositories = sync_service_with_semantic.semantic_search.add_repositories
+        add_repositories.assert_awaited_once()
+        assert [r["name_with_owner"] for r in add_repositories.await_args.args[0]] == ["owner/fresh"]
+
+    @staticmethod
+    async def _seed_repo(db, **overrides) -> dict:
+        """Insert owner/repo1 and return its sync index row."""
         await db.add_repository({
             "name_with_owner": "owner/repo1",
             "name": "repo1",
             "owner": "owner",
-            "description": "Old description",
+            "description": "Test description",
             "primary_language": "Python",
+            "languages": [{"name": "Python", "size": 1000}],
             "topics": [],
             "stargazer_count": 100,
             "fork_count": 20,
             "url": "https://github.com/owner/repo1",
-            "homepage_url": None,
-            "pushed_at": "2023-12-01T00:00:00",
-            "archived": 0,
+            "pushed_at": datetime(2023, 12, 1).isoformat(),
             "visibility": "public",
             "owner_type": "User",
-            "last_synced_at": datetime(2023, 11, 1).isoformat(),
             "summary": "Test",
-            "categories": [],
-            "features": [],
-            "use_cases": []
+            **overrides
         })
+        return {
+            r["name_with_owner"]: r
+            async for r in db.iter_repositories(columns=SYNC_DIFF_COLUMNS)
+        }
 
+    @pytest.mark.asyncio
+    async def test_process_updates_with_semantic_field_change(self, sync_service_with_semantic, db, mocker, github_repo_factory):
+        """Test that updating semantic fields triggers vector index update."""
+        local_repo_map = await self._seed_repo(db, description="Old description")
         github_repo = github_repo_factory(
             name_with_owner="owner/repo1",
             name="repo1",
             description="New description",  # Changed - semantic field
             primary_language="Python",
-            languages=[],
-            readme_content=None
         )
+        get_repository = mocker.spy(db, "get_repository")
+        stats = {"updated": 0, "failed": 0, "errors": []}
 
-        # Update with semantic field change
-        await sync_service_with_semantic._update_repository(
-            name_with_owner="owner/repo1",
-            github_repo=github_repo,
-            change_type="light",
-            changed_fields={"description": "New description"},
-            needs_llm=False,
-            skip_llm=True
+        await sync_service_with_semantic._process_updates(
+            {"owner/repo1": github_repo}, local_repo_map, {"owner/repo1"}, stats, skip_llm=True
         )
 
-        # Verify vector index was updated
-        assert sync_service_with_semantic.semantic_search.update_repository.called
+        # Verify vector index was updated from the GitHub data without re-reading the row
+        assert stats["updated"] == 1
+        sync_service_with_semantic.semantic_search.update_repository.assert_awaited_once()
+        indexed = sync_service_with_semantic.semantic_search.update_repository.await_args.args[0]
+        assert indexed["name_with_owner"] == "owner/repo1"
+        assert indexed["description"] == "New description"
+        get_repository.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_update_repository_without_semantic_field_change(self, sync_service_with_semantic, db, github_repo_factory):
+    async def test_process_updates_without_semantic_field_change(self, sync_service_with_semantic, db, github_repo_factory):
         """Test that updating non-semantic fields does not trigger vector index update."""
-        # Add existing repo
-        await db.add_repository({
-            "name_with_owner": "owner/repo1",
-            "name": "repo1",
-            "owner": "owner",
-            "description": "Test description",
-            "primary_language": "Python",
-            "topics": [],
-            "stargazer_count": 100,
-            "fork_count": 20,
-            "url": "https://github.com/owner/repo1",
-            "homepage_url": None,
-            "pushed_at": "2023-12-01T00:00:00",
-            "archived": 0,
-            "visibility": "public",
-            "owner_type": "User",
-            "last_synced_at": datetime(2023, 11, 1).isoformat(),
-            "summary": "Test",
-            "categories": [],
-            "features": [],
-            "use_cases": []
-        })
-
+        local_repo_map = await self._seed_repo(db)
         github_repo = github_repo_factory(
             name_with_owner="owner/repo1",
             name="repo1",
             description="Test description",  # Same
             primary_language="Python",
             stargazer_count=150,  # Changed - not semantic field
-            languages=[],
-            readme_content=None
         )
+        stats = {"updated": 0, "failed": 0, "errors": []}
 
-        # Update without semantic field change
-        await sync_service_with_semantic._update_repository(
-            name_with_owner="owner/repo1",
-            github_repo=github_repo,
-            change_type="light",
-            changed_fields={"stargazer_count": 150},
-            needs_llm=False,
-            skip_llm=True
+        await sync_service_with_semantic._process_updates(
+            {"owner/repo1": github_repo}, local_repo_map, {"owner/repo1"}, stats, skip_llm=True
         )
 
-        # Verify vector index was NOT updated
+        # Verify the row changed but the vector index was NOT updated
+        assert stats["updated"] == 1
+        assert (await db.get_repository("owner/repo1"))["stargazer_count"] == 150
         assert not sync_service_with_semantic.semantic_search.update_repository.called
 
     @pytest.mark.asyncio
@@ -695,8 +782,10 @@ class TestSemanticSearchIntegration:
         stats = {"deleted": 0, "failed": 0, "errors": []}
         await sync_service_with_semantic._process_deletions({"owner/repo1"}, stats)
 
-        # Verify vector index was updated
-        assert sync_service_with_semantic.semantic_search.delete_repository.called
+        # Verify vector index was updated in one batch
+        sync_service_with_semantic.semantic_search.delete_repositories.assert_awaited_once_with(
+            ["owner/repo1"]
+        )
 
     def test_needs_vector_update_with_semantic_fields(self, sync_service):
         """Test _needs_vector_update correctly identifies semantic field changes."""
@@ -1,8 +1,14 @@
 """Unit tests for Vectorization Service."""
 
+import threading
+import time
+
+import orjson
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from src.services.vectorization import VectorizationService
+from src.services import vectorization
+from src.services.vectorization import VectorizationService, _readme_summary_cache
+from src.vector.embeddings import EMBED_CONCURRENCY
 
 
 @pytest.fixture
@@ -11,6 +17,7 @@ def mock_embeddings():
     with patch('src.services.vectorization.OllamaEmbeddings') as mock:
         instance = mock.return_value
         instance.embed_text.return_value = [0.1] * 768
+        instance.model = "nomic-embed-text"
         yield instance
 
 
@@ -20,6 +27,7 @@ def mock_store():
     with patch('src.services.vectorization.ChromaDBStore') as mock:
         instance = mock.return_value
         instance.add_batch.return_value = 1
+        instance.get_embeddings.return_value = {}
         yield instance
 
 
@@ -40,6 +48,7 @@ async def test_index_repository(mock_embeddings, mock_store):
     assert result is True
     mock_embeddings.embed_text.assert_called_once()
     mock_store.add.assert_called_once()
+    mock_store.get_embeddings.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -150,6 +159,58 @@ async def test_index_batch_partial_failures(mock_embeddings, mock_store):
     mock_store.add_batch.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_index_batch_reuses_stored_embeddings(mock_embeddings, mock_store):
+    """测试文本未变化的仓库复用已存储的 embedding"""
+    service = VectorizationService(mock_embeddings, mock_store)
+
+    repos = [
+        {
+            "name_with_owner": f"test/repo{i}",
+            "name": f"repo{i}",
+            "description": f"Test {i}",
+        }
+        for i in range(3)
+    ]
+    current = {"embedding_model": "nomic-embed-text"}
+    mock_store.get_embeddings.return_value = {
+        "test/repo0": (service._prepare_text(repos[0]), [0.9] * 768, current),
+        "test/repo1": ("stale text", [0.8] * 768, current),
+    }
+
+    count = await service.index_batch(repos)
+
+    assert count == 3
+    assert mock_embeddings.embed_text.call_count == 2
+    ids, _, embeddings, metadata_list = mock_store.add_batch.call_args.args
+    assert ids == ["test/repo0", "test/repo1", "test/repo2"]
+    assert embeddings[0] == [0.9] * 768
+    assert embeddings[1] == [0.1] * 768
+    assert metadata_list[0]["embedding_model"] == "nomic-embed-text"
+
+
+@pytest.mark.asyncio
+async def test_index_batch_reembeds_when_model_changed(mock_embeddings, mock_store):
+    """测试换了 embedding 模型后不复用旧向量"""
+    service = VectorizationService(mock_embeddings, mock_store)
+
+    repos = [
+        {"name_with_owner": "test/old-model", "name": "old-model", "description": "Test old"},
+        {"name_with_owner": "test/no-model", "name": "no-model", "description": "Test none"},
+    ]
+    mock_store.get_embeddings.return_value = {
+        "test/old-model": (service._prepare_text(repos[0]), [0.9] * 768, {"embedding_model": "other-model"}),
+        "test/no-model": (service._prepare_text(repos[1]), [0.9] * 768, {}),
+    }
+
+    count = await service.index_batch(repos)
+
+    assert count == 2
+    assert mock_embeddings.embed_text.call_count == 2
+    _, _, embeddings, _ = mock_store.add_batch.call_args.args
+    assert embeddings == [[0.1] * 768, [0.1] * 768]
+
+
 def test_prepare_text_full_repo(mock_embeddings, mock_store):
     """测试文本准备 - 完整仓库信息"""
     service = VectorizationService(mock_embeddings, mock_store)
@@ -167,6 +228,30 @@ def test_prepare_text_full_repo(mock_embeddings, mock_store):
     assert "Test Repo" in text
 
 
+def test_prepare_text_is_memoized(mock_embeddings, mock_store, mocker):
+    """测试相同 README 的摘要按内容摘要缓存复用"""
+    service = VectorizationService(mock_embeddings, mock_store)
+    _readme_summary_cache.clear()
+    summarize = mocker.spy(vectorization, "_summarize_readme")
+
+    repo = {
+        "name": "test-repo",
+        "description": "A test repository",
+        "readme_content": "# Test Repo\n\n[![badge](x)](y) This is a great project for testing."
+    }
+
+    first = service._prepare_text(repo)
+    second = service._prepare_text({**repo, "description": "Another description"})
+    changed = service._prepare_text({**repo, "readme_content": "# Other\n\nNew content"})
+
+    assert first.split("\n\n", 1)[1] == second.split("\n\n", 1)[1]
+    assert "Another description" in second
+    assert "New content" in changed
+    assert summarize.call_count == 2
+    # 缓存键是 sha1 摘要，不持有 README 原文
+    assert all(isinstance(key, bytes) and len(key) == 20 for key in _readme_summary_cache)
+
+
 def test_prepare_metadata(mock_embeddings, mock_store):
     """测试元数据准备"""
     service = VectorizationService(mock_embeddings, mock_store)
@@ -186,3 +271,42 @@ def test_prepare_metadata(mock_embeddings, mock_store):
     assert metadata["primary_language"] == "Python"
     assert metadata["stargazer_count"] == 100
     assert "ai" in metadata["topics"]
+    assert orjson.loads(metadata["topics"]) == ["ai", "ml", "python"]
+    assert orjson.loads(service._prepare_metadata({"topics": None})["topics"]) == []
+
+
+@pytest.mark.asyncio
+async def test_index_batch_embeds_concurrently(mock_embeddings, mock_store):
+    """测试批量索引并发生成 embedding，且并发数有上限"""
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def slow_embed(text):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return [0.1] * 768
+
+    mock_embeddings.embed_text.side_effect = slow_embed
+    service = VectorizationService(mock_embeddings, mock_store)
+
+    repos = [
+        {
+            "name_with_owner": f"test/repo{i}",
+            "name": f"repo{i}",
+            "description": f"Test {i}",
+        }
+        for i in range(EMBED_CONCURRENCY * 2)
+    ]
+
+    count = await service.index_batch(repos)
+
+    assert count == EMBED_CONCURRENCY * 2
+    assert 1 < peak <= EMBED_CONCURRENCY
+    ids = mock_store.add_batch.call_args.args[0]
+    assert ids == [repo["name_with_owner"] for repo in repos]